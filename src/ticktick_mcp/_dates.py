@@ -0,0 +1,33 @@
+"""
+ISO-8601 parsing for TickTick timestamps.
+
+Uses ciso8601 when it is installed; otherwise normalises the forms TickTick
+sends ("Z" and "+0000" offsets) so datetime.fromisoformat accepts them on
+every supported Python version.
+"""
+
+import re
+from datetime import datetime
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # pragma: no cover - optional dependency
+    _parse_datetime = None
+
+_COMPACT_OFFSET = re.compile(r"([+-]\d{2})(\d{2})$")
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp such as "2024-12-31T23:59:59.000+0000".
+
+    Raises:
+        ValueError: If the value is not a valid ISO-8601 timestamp
+    """
+    if _parse_datetime is not None:
+        return _parse_datetime(value)
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    else:
+        value = _COMPACT_OFFSET.sub(r"\1:\2", value, count=1)
+    return datetime.fromisoformat(value)
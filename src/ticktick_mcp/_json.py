@@ -0,0 +1,51 @@
+"""
+JSON helpers that use orjson when it is installed and fall back to stdlib json.
+
+Install the speedup with: pip install ticktick-mcp[speedups]
+"""
+
+import json
+from typing import Any, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize Pydantic models via their API aliases; anything else via str()."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return str(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize to a JSON string.
+
+    Args:
+        obj: Data to serialize; Pydantic models are dumped by alias and other
+            unknown types are converted with str()
+        indent: Pretty-print with 2-space indentation instead of compact output
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=_default)
+    return json.dumps(obj, separators=(",", ":"), default=_default)
@@ -140,14 +140,14 @@ class TickTickClient:
         """Save OAuth token to cache."""
         self._oauth_token = token
         oauth_file = self.token_path / "oauth_token.json"
-        oauth_file.write_text(json.dumps(token.model_dump(), default=str, indent=2))
+        oauth_file.write_text(token.model_dump_json(indent=2))
         logger.debug("OAuth token saved to cache")
 
     def _save_session_token(self, token: SessionToken) -> None:
         """Save session token to cache."""
         self._session_token = token
         session_file = self.token_path / "session_token.json"
-        session_file.write_text(json.dumps(token.model_dump(), default=str, indent=2))
+        session_file.write_text(token.model_dump_json(indent=2))
         logger.debug("Session token saved to cache")
 
     def _save_config(self, config: Dict[str, Any]) -> None:
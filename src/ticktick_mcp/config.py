@@ -7,16 +7,51 @@ Supports loading configuration from:
 - Default values
 """
 
-import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import logging
 
+from . import _json
+
 logger = logging.getLogger(__name__)
 
+# Parsed config files keyed by absolute path -> (mtime_ns, size, data)
+_FILE_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _read_config_file(path: Path) -> Dict[str, Any]:
+    """
+    Read and parse a JSON config file, reusing the last parse if unchanged.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    key = str(path.resolve())
+    st = os.stat(key)
+    cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    with open(key, "rb") as f:
+        data = _json.loads(f.read())
+    _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+# Per-user default config locations, resolved once at import
+_HOME_CONFIG_PATHS = (
+    Path.home() / ".config" / "ticktick-mcp" / "config.json",
+    Path.home() / ".ticktick-mcp.json",
+)
+
+
+def clear_config_cache() -> None:
+    """Forget all cached config file parses."""
+    _FILE_CACHE.clear()
+
 
 @dataclass
 class OAuthConfig:
@@ -87,14 +122,12 @@ class TickTickConfig:
     @classmethod
     def from_file(cls, path: str) -> "TickTickConfig":
         """Load configuration from JSON file."""
-        config_path = Path(path)
-        if not config_path.exists():
+        try:
+            data = _read_config_file(Path(path))
+        except FileNotFoundError:
             logger.warning(f"Config file not found: {path}")
             return cls()
 
-        with open(config_path) as f:
-            data = json.load(f)
-
         config = cls()
 
         # OAuth
@@ -153,11 +186,7 @@ class TickTickConfig:
             config.api = file_config.api
         else:
             # Try default config paths
-            default_paths = [
-                Path.home() / ".config" / "ticktick-mcp" / "config.json",
-                Path.home() / ".ticktick-mcp.json",
-                Path.cwd() / "ticktick-config.json",
-            ]
+            default_paths = [*_HOME_CONFIG_PATHS, Path.cwd() / "ticktick-config.json"]
             for default_path in default_paths:
                 if default_path.exists():
                     logger.info(f"Loading config from: {default_path}")
@@ -215,6 +244,6 @@ class TickTickConfig:
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(config_path, "w") as f:
-            json.dump(config_data, f, indent=2)
+            f.write(_json.dumps(config_data, indent=True))
 
         logger.info(f"Configuration saved to: {path}")
@@ -0,0 +1,43 @@
+"""
+Generated alias remappers for trusted API payloads.
+
+Each remapper is compiled once per model so renaming camelCase API keys to
+field names runs as straight-line bytecode instead of a per-key lookup loop.
+"""
+
+from typing import Any, Callable, Dict
+
+from pydantic import BaseModel
+
+Remap = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def build_remap(aliases: Dict[str, str]) -> Remap:
+    """
+    Compile a function that renames alias keys to field names.
+
+    Keys without an alias (and unknown extra keys) are passed through as-is.
+
+    Args:
+        aliases: Mapping of API key -> model field name
+
+    Returns:
+        Function taking an API dict and returning a new, remapped dict
+    """
+    lines = ["def remap(data):", "    out = dict(data)"]
+    for alias, name in aliases.items():
+        lines.append(f"    if {alias!r} in out: out[{name!r}] = out.pop({alias!r})")
+    lines.append("    return out")
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<remap>", "exec"), namespace)
+    return namespace["remap"]
+
+
+def build_model_remap(model: type[BaseModel]) -> Remap:
+    """Compile a remapper for every aliased field of a Pydantic model."""
+    return build_remap({
+        field.alias: name
+        for name, field in model.model_fields.items()
+        if field.alias and field.alias != name
+    })
@@ -3,10 +3,12 @@ Project and Folder models for TickTick API.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ._remap import build_model_remap
+
 
 class ProjectKind(str, Enum):
     """Project type classification."""
@@ -60,6 +62,36 @@ class Project(BaseModel):
     team_id: Optional[str] = Field(default=None, alias="teamId")
     permission: Optional[ProjectPermission] = Field(default=None)
 
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "Project":
+        """
+        Build a Project from a trusted API payload without full validation.
+
+        Falls back to regular validation when required fields are missing or
+        null, or an enum value is not recognised.
+        """
+        if not all(data.get(key) is not None for key in _PROJECT_REQUIRED):
+            return cls.model_validate(data)
+        try:
+            values = _PROJECT_REMAP(data)
+            for name, convert in _PROJECT_CONVERTERS.items():
+                value = values.get(name)
+                if value is not None:
+                    values[name] = convert(value)
+        except (TypeError, ValueError):
+            return cls.model_validate(data)
+        return cls.model_construct(**values)
+
+
+# Compiled alias remapper and per-field converters used by Project.from_api
+_PROJECT_REMAP = build_model_remap(Project)
+_PROJECT_REQUIRED = frozenset({"id", "name"})
+_PROJECT_CONVERTERS = {
+    "kind": ProjectKind,
+    "view_mode": ProjectViewMode,
+    "permission": ProjectPermission,
+}
+
 
 class ProjectCreate(BaseModel):
     """Model for creating a new project/list."""
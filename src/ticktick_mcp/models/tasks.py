@@ -6,7 +6,9 @@ from datetime import datetime
 from enum import IntEnum, Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+from ._remap import build_model_remap
 
 
 class TaskPriority(IntEnum):
@@ -19,13 +21,7 @@ class TaskPriority(IntEnum):
     @classmethod
     def from_string(cls, value: str) -> "TaskPriority":
         """Convert string to priority."""
-        mapping = {
-            "none": cls.NONE,
-            "low": cls.LOW,
-            "medium": cls.MEDIUM,
-            "high": cls.HIGH,
-        }
-        return mapping.get(value.lower(), cls.NONE)
+        return _PRIORITY_MAP.get(value.lower(), cls.NONE)
 
     def to_emoji(self) -> str:
         """Convert priority to emoji representation."""
@@ -38,6 +34,14 @@ class TaskPriority(IntEnum):
         return mapping.get(self, "")
 
 
+_PRIORITY_MAP: dict[str, TaskPriority] = {
+    "none": TaskPriority.NONE,
+    "low": TaskPriority.LOW,
+    "medium": TaskPriority.MEDIUM,
+    "high": TaskPriority.HIGH,
+}
+
+
 class TaskStatus(IntEnum):
     """Task status values."""
     INCOMPLETE = 0
@@ -164,6 +168,51 @@ class Task(BaseModel):
     # Progress (for tasks with subtasks)
     progress: Optional[int] = Field(default=None, ge=0, le=100)
 
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "Task":
+        """
+        Build a Task from a trusted API payload without full validation.
+
+        Field aliases, enums and nested items/reminders are converted directly;
+        payloads with missing or null required fields or unknown enum values
+        fall back to regular validation.
+        """
+        if not all(data.get(key) is not None for key in _TASK_REQUIRED):
+            return cls.model_validate(data)
+        try:
+            values = _TASK_REMAP(data)
+            for name, convert in _TASK_CONVERTERS.items():
+                value = values.get(name)
+                if value is not None:
+                    values[name] = convert(value)
+        except (TypeError, ValueError):
+            return cls.model_validate(data)
+        return cls.model_construct(**values)
+
+
+# Compiled alias remapper and per-field converters used by Task.from_api
+_TASK_REMAP = build_model_remap(Task)
+_TASK_REQUIRED = frozenset({"id", "projectId", "title"})
+_TASK_CONVERTERS = {
+    "status": TaskStatus,
+    "priority": TaskPriority,
+    "kind": TaskKind,
+    "items": lambda items: [ChecklistItem.model_validate(i) for i in items],
+    "reminders": lambda reminders: [Reminder.model_validate(r) for r in reminders],
+}
+
+_TASK_LIST_ADAPTER = TypeAdapter(list[Task])
+
+
+def dump_task_list_json(tasks: list[Task], compact: bool = False) -> str:
+    """Serialize a list of tasks as JSON using API field names."""
+    return _TASK_LIST_ADAPTER.dump_json(
+        tasks,
+        by_alias=True,
+        exclude_none=True,
+        indent=None if compact else 2,
+    ).decode()
+
 
 class TaskCreate(BaseModel):
     """Model for creating a new task."""
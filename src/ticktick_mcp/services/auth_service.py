@@ -3,6 +3,7 @@ Authentication Service - Wrapper for authentication operations.
 """
 
 import logging
+from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from ..api.client import TickTickClient
@@ -91,7 +92,6 @@ class AuthService(BaseService):
 
         expires_at = None
         if status_dict.get("oauth", {}).get("expires_in_seconds"):
-            from datetime import datetime, timedelta
             expires_at = datetime.now() + timedelta(
                 seconds=status_dict["oauth"]["expires_in_seconds"]
             )
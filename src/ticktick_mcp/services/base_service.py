@@ -3,9 +3,11 @@ Base service class for TickTick operations.
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 
+from .. import _json
 from ..api.client import TickTickClient
 from ..api.endpoints import APIVersion
 
@@ -20,6 +22,9 @@ class BaseService(ABC, Generic[T]):
     Provides common functionality for API interactions, caching, and response formatting.
     """
 
+    # Seconds a cached value stays fresh
+    CACHE_TTL: float = 300.0
+
     def __init__(self, client: TickTickClient):
         """
         Initialize service with API client.
@@ -28,7 +33,9 @@ class BaseService(ABC, Generic[T]):
             client: Configured TickTickClient instance
         """
         self.client = client
-        self._cache: Dict[str, Any] = {}
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # Bumped by every write to the cache; reads compare against it
+        self._cache_version = 0
 
     @property
     def is_v2_available(self) -> bool:
@@ -44,6 +51,7 @@ class BaseService(ABC, Generic[T]):
 
     def clear_cache(self) -> None:
         """Clear service cache."""
+        self._cache_version += 1
         self._cache.clear()
 
     def _cache_key(self, *args) -> str:
@@ -51,12 +59,40 @@ class BaseService(ABC, Generic[T]):
         return ":".join(str(a) for a in args)
 
     def _get_cached(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
-        return self._cache.get(key)
+        """Get value from cache, or None if missing or expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        return value
+
+    def _set_cached(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        version: Optional[int] = None,
+    ) -> None:
+        """
+        Set value in cache with a TTL (defaults to CACHE_TTL).
 
-    def _set_cached(self, key: str, value: Any) -> None:
-        """Set value in cache."""
-        self._cache[key] = value
+        Reads pass the _cache_version captured before their fetch and are
+        skipped if a write has happened since; stores without a version
+        are writes and bump it.
+        """
+        if version is None:
+            self._cache_version += 1
+        elif version != self._cache_version:
+            return
+        self._cache[key] = (time.monotonic() + (self.CACHE_TTL if ttl is None else ttl), value)
+
+    def _invalidate_cached(self, key: str) -> None:
+        """Drop a single cache entry."""
+        self._cache_version += 1
+        self._cache.pop(key, None)
 
     def _format_response(
         self,
@@ -75,17 +111,15 @@ class BaseService(ABC, Generic[T]):
         Returns:
             Formatted string
         """
-        import json
-
         if format_type == "json":
-            return json.dumps(data, indent=2, default=str)
+            return _json.dumps(data, indent=True)
         elif format_type == "compact":
-            return json.dumps(data, separators=(",", ":"), default=str)
+            return _json.dumps(data)
         else:
             # Default markdown formatting - subclasses should override
             if title:
-                return f"## {title}\n\n```json\n{json.dumps(data, indent=2, default=str)}\n```"
-            return f"```json\n{json.dumps(data, indent=2, default=str)}\n```"
+                return f"## {title}\n\n```json\n{_json.dumps(data, indent=True)}\n```"
+            return f"```json\n{_json.dumps(data, indent=True)}\n```"
 
     def _handle_error(self, error: Exception, operation: str) -> str:
         """
@@ -170,9 +170,16 @@ class FocusService(BaseService[FocusSession]):
         """
         self._require_v2()
 
+        cached = self._get_cached("settings")
+        if cached is not None:
+            return cached
+
+        version = self._cache_version
         url = Endpoints.Focus.settings()
         data = await self.client.get(url, version=APIVersion.V2)
-        return PomoSettings(**data)
+        settings = PomoSettings(**data)
+        self._set_cached("settings", settings, version=version)
+        return settings
 
     async def update_settings(self, settings: PomoSettings) -> PomoSettings:
         """
@@ -189,7 +196,11 @@ class FocusService(BaseService[FocusSession]):
         payload = settings.model_dump(by_alias=True, exclude_none=True)
         url = Endpoints.Focus.settings()
         data = await self.client.post(url, version=APIVersion.V2, data=payload)
-        return PomoSettings(**data)
+        updated = PomoSettings(**data)
+        # Storing as a write bumps the cache version, so a GET still in
+        # flight from get_settings won't overwrite this with old settings
+        self._set_cached("settings", updated)
+        return updated
 
     # =========================================================================
     # Statistics
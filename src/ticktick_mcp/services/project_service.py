@@ -36,12 +36,13 @@ class ProjectService(CRUDService[Project]):
     # Project CRUD Operations
     # =========================================================================
 
-    async def list(self, include_archived: bool = False) -> List[Project]:
+    async def list(self, include_archived: bool = False, strict: bool = False) -> List[Project]:
         """
         List all projects.
 
         Args:
             include_archived: Include archived projects
+            strict: Fully validate each project instead of the trusted fast path
 
         Returns:
             List of Project objects
@@ -49,7 +50,8 @@ class ProjectService(CRUDService[Project]):
         url = Endpoints.Projects.list_v1()
         data = await self.client.get(url, version=APIVersion.V1)
 
-        projects = [Project(**p) for p in data] if isinstance(data, list) else []
+        build = Project.model_validate if strict else Project.from_api
+        projects = [build(p) for p in data] if isinstance(data, list) else []
 
         if not include_archived:
             projects = [p for p in projects if not p.closed]
@@ -100,7 +102,7 @@ class ProjectService(CRUDService[Project]):
         url = Endpoints.Projects.create_v1()
         data = await self.client.post(url, version=APIVersion.V1, data=payload)
 
-        return Project(**data)
+        return Project.from_api(data)
 
     async def update(self, project_data: ProjectUpdate) -> Project:
         """
@@ -150,7 +152,7 @@ class ProjectService(CRUDService[Project]):
 
         updated = data.get("update", [])
         if updated:
-            return Project(**updated[0])
+            return Project.from_api(updated[0])
         return await self.get(project_data.id)
 
     async def delete(self, project_id: str) -> bool:
@@ -264,7 +266,7 @@ class ProjectService(CRUDService[Project]):
             data={"add": payloads}
         )
 
-        return [Project(**p) for p in data.get("add", [])]
+        return [Project.from_api(p) for p in data.get("add", [])]
 
     async def batch_delete(self, project_ids: List[str]) -> bool:
         """
@@ -16,6 +16,7 @@ from ..models.tags import (
     TagMerge,
     TagFilter,
 )
+from ..models.tasks import dump_task_list_json
 from .base_service import CRUDService
 
 logger = logging.getLogger(__name__)
@@ -408,3 +409,7 @@ class TagService(CRUDService[Tag]):
                 lines.append("  " + self.format_tag(child))
 
         return "\n".join(lines)
+
+    def format_task_list_json(self, tasks: List[Any], compact: bool = False) -> str:
+        """Serialize tagged tasks as JSON."""
+        return dump_task_list_json(tasks, compact=compact)
@@ -2,10 +2,13 @@
 Task Service - Comprehensive task management operations.
 """
 
+import asyncio
+import io
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from .._dates import parse_iso_datetime
 from ..api.client import TickTickClient
 from ..api.endpoints import APIVersion, Endpoints
 from ..api.exceptions import NotFoundError
@@ -16,11 +19,15 @@ from ..models.tasks import (
     TaskPriority,
     TaskStatus,
     TaskFilter,
+    dump_task_list_json,
 )
 from .base_service import CRUDService
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of project task fetches in flight for an all-projects list
+_PROJECT_FETCH_CONCURRENCY = 16
+
 
 class TaskService(CRUDService[Task]):
     """
@@ -41,6 +48,7 @@ class TaskService(CRUDService[Task]):
         self,
         project_id: Optional[str] = None,
         include_completed: bool = False,
+        strict: bool = False,
         **filters,
     ) -> List[Task]:
         """
@@ -49,7 +57,8 @@ class TaskService(CRUDService[Task]):
         Args:
             project_id: Filter by specific project (None for all)
             include_completed: Include completed tasks
-            **filters: Additional filter parameters
+            strict: Fully validate each task instead of the trusted fast path
+            **filters: Additional filter parameters (None values are ignored)
 
         Returns:
             List of Task objects
@@ -58,38 +67,45 @@ class TaskService(CRUDService[Task]):
 
         if project_id:
             # Get tasks for specific project
-            tasks = await self._get_project_tasks(project_id)
+            tasks = await self._get_project_tasks(project_id, strict)
         else:
             # Get all tasks from all projects
             from .project_service import ProjectService
             project_service = ProjectService(self.client)
-            projects = await project_service.list()
+            projects = await project_service.list(strict=strict)
+
+            # Fetch projects concurrently, bounded so large accounts don't
+            # open one request per project at once. Failed projects are
+            # logged and come back empty from _get_project_tasks.
+            limit = asyncio.Semaphore(_PROJECT_FETCH_CONCURRENCY)
+
+            async def fetch(project_id: str) -> List[Task]:
+                async with limit:
+                    return await self._get_project_tasks(project_id, strict)
 
-            for project in projects:
-                try:
-                    project_tasks = await self._get_project_tasks(project.id)
-                    tasks.extend(project_tasks)
-                except Exception as e:
-                    logger.warning(f"Failed to get tasks for project {project.id}: {e}")
+            results = await asyncio.gather(*(fetch(project.id) for project in projects))
+            for project_tasks in results:
+                tasks.extend(project_tasks)
 
         # Apply filters
         if not include_completed:
             tasks = [t for t in tasks if t.status != TaskStatus.COMPLETE]
 
-        # Apply additional filters
-        task_filter = TaskFilter(**filters) if filters else None
-        if task_filter:
-            tasks = self._apply_filters(tasks, task_filter)
+        # Apply additional filters (None means "not filtered")
+        filters = {k: v for k, v in filters.items() if v is not None}
+        if filters:
+            tasks = self._apply_filters(tasks, TaskFilter(**filters))
 
         return tasks
 
-    async def _get_project_tasks(self, project_id: str) -> List[Task]:
+    async def _get_project_tasks(self, project_id: str, strict: bool = False) -> List[Task]:
         """Get all tasks for a specific project."""
         try:
             url = Endpoints.Projects.data_v1(project_id)
             data = await self.client.get(url, version=APIVersion.V1)
             raw_tasks = data.get("tasks", [])
-            return [Task(**t) for t in raw_tasks]
+            build = Task.model_validate if strict else Task.from_api
+            return [build(t) for t in raw_tasks]
         except Exception as e:
             logger.error(f"Error fetching tasks for project {project_id}: {e}")
             return []
@@ -110,7 +126,7 @@ class TaskService(CRUDService[Task]):
         """
         url = Endpoints.Tasks.get_v1(project_id, task_id)
         data = await self.client.get(url, version=APIVersion.V1)
-        return Task(**data)
+        return Task.from_api(data)
 
     async def create(self, task_data: TaskCreate) -> Task:
         """
@@ -127,7 +143,7 @@ class TaskService(CRUDService[Task]):
         url = Endpoints.Tasks.create_v1()
         data = await self.client.post(url, version=APIVersion.V1, data=payload)
 
-        return Task(**data)
+        return Task.from_api(data)
 
     async def update(self, task_data: TaskUpdate) -> Task:
         """
@@ -150,7 +166,7 @@ class TaskService(CRUDService[Task]):
         url = Endpoints.Tasks.update_v1(task_data.id)
         data = await self.client.post(url, version=APIVersion.V1, data=update_payload)
 
-        return Task(**data)
+        return Task.from_api(data)
 
     async def delete(self, task_id: str, project_id: str) -> bool:
         """
@@ -221,7 +237,7 @@ class TaskService(CRUDService[Task]):
 
         url = Endpoints.Tasks.update_v1(task_id)
         data = await self.client.post(url, version=APIVersion.V1, data=payload)
-        return Task(**data)
+        return Task.from_api(data)
 
     async def move(
         self,
@@ -334,7 +350,7 @@ class TaskService(CRUDService[Task]):
             url = Endpoints.Tasks.completed_v2()
 
         data = await self.client.get(url, version=APIVersion.V2, params=params)
-        return [Task(**t) for t in data] if isinstance(data, list) else []
+        return [Task.from_api(t) for t in data] if isinstance(data, list) else []
 
     # =========================================================================
     # Batch Operations
@@ -359,7 +375,7 @@ class TaskService(CRUDService[Task]):
             data={"add": payloads}
         )
 
-        return [Task(**t) for t in data.get("add", [])]
+        return [Task.from_api(t) for t in data.get("add", [])]
 
     async def batch_update(self, tasks: List[TaskUpdate]) -> List[Task]:
         """
@@ -392,7 +408,7 @@ class TaskService(CRUDService[Task]):
             data={"update": payloads}
         )
 
-        return [Task(**t) for t in data.get("update", [])]
+        return [Task.from_api(t) for t in data.get("update", [])]
 
     async def batch_delete(
         self,
@@ -483,14 +499,14 @@ class TaskService(CRUDService[Task]):
             due_before = datetime.fromisoformat(filters.due_before)
             result = [
                 t for t in result
-                if t.due_date and datetime.fromisoformat(t.due_date.replace("Z", "+00:00")) <= due_before
+                if t.due_date and parse_iso_datetime(t.due_date) <= due_before
             ]
 
         if filters.due_after:
             due_after = datetime.fromisoformat(filters.due_after)
             result = [
                 t for t in result
-                if t.due_date and datetime.fromisoformat(t.due_date.replace("Z", "+00:00")) >= due_after
+                if t.due_date and parse_iso_datetime(t.due_date) >= due_after
             ]
 
         if filters.search_query:
@@ -543,7 +559,10 @@ class TaskService(CRUDService[Task]):
         if not tasks:
             return f"##  {title}\n\nNo tasks found."
 
-        lines = [f"##  {title} ({len(tasks)} total)\n"]
+        # Write straight into one buffer instead of a list that is joined later
+        out = io.StringIO()
+        write = out.write
+        write(f"##  {title} ({len(tasks)} total)\n")
 
         # Group by project
         by_project: Dict[str, List[Task]] = {}
@@ -554,11 +573,17 @@ class TaskService(CRUDService[Task]):
             by_project[pid].append(task)
 
         for project_id, project_tasks in by_project.items():
-            lines.append(f"\n### Project: `{project_id}`\n")
+            write(f"\n\n### Project: `{project_id}`\n")
             # Sort by priority
             sorted_tasks = sorted(project_tasks, key=lambda t: t.priority, reverse=True)
             for task in sorted_tasks:
-                lines.append(self.format_task(task))
-                lines.append("")
+                write("\n")
+                write(self.format_task(task))
+                write("\n")
 
-        return "\n".join(lines)
+        return out.getvalue()
+
+    @staticmethod
+    def format_task_list_json(tasks: List[Task], compact: bool = False) -> str:
+        """Serialize a list of tasks as JSON using API field names."""
+        return dump_task_list_json(tasks, compact=compact)
@@ -0,0 +1,40 @@
+"""
+Shared helpers for MCP tool responses.
+"""
+
+_V2_NOTE = "\n\n_Note: This feature requires v2 API authentication._"
+
+# Tool annotation hints, merged into each tool's annotations with its title
+READ_ONLY = {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True}
+WRITE_CREATE = {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False}
+WRITE_IDEMPOTENT = {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": True}
+WRITE_DESTRUCTIVE = {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": True}
+
+
+def format_error(message: str, exc: BaseException, v2: bool = False) -> str:
+    """
+    Format a tool error response.
+
+    Args:
+        message: What failed (e.g., "Failed to create tag")
+        exc: The exception raised
+        v2: Append the v2 API authentication note
+
+    Returns:
+        Markdown error string
+    """
+    text = f"**Error**: {message} - {exc}"
+    return text + _V2_NOTE if v2 else text
+
+
+def register_tools(mcp, specs) -> None:
+    """
+    Register tool functions from a declarative table.
+
+    Args:
+        mcp: FastMCP server instance
+        specs: Iterable of (func, tool_name, annotations) tuples; the
+            function's docstring becomes the tool description
+    """
+    for func, name, annotations in specs:
+        mcp.tool(name=name, annotations=annotations)(func)
@@ -3,16 +3,47 @@ Tag MCP tools - Tag management (v2 API only).
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..models.common import ResponseFormat
+from ..models.tags import TagCreate, TagUpdate
+from ..models.tasks import TaskStatus
+from .common import (
+    READ_ONLY,
+    WRITE_CREATE,
+    WRITE_DESTRUCTIVE,
+    WRITE_IDEMPOTENT,
+    format_error,
+    register_tools,
+)
+
+_STATUS_EMOJI = {TaskStatus.COMPLETE: "✅"}
+
+# Response templates
+_TAG_CREATED_TMPL = "## Tag Created\n\n- **Name**: {name}\n- **Color**: {color}\n- **Parent**: {parent}\n"
+_TAG_UPDATED_TMPL = "## Tag Updated\n\n- **Name**: {name}\n- **Color**: {color}\n"
+_TAG_RENAMED_TMPL = (
+    "## Tag Renamed\n\n- **Old Name**: {old_name}\n- **New Name**: {new_name}\n\n"
+    "All tasks have been updated.\n"
+)
+_TAGS_MERGED_TMPL = (
+    "## Tags Merged\n\n- **Merged**: `{source}` → `{target}`\n"
+    "- The source tag has been deleted\n- All tasks now use the target tag\n"
+)
+_TAG_DELETED_TMPL = "## Tag Deleted\n\nTag `{name}` has been deleted and removed from all tasks."
+_TAG_TASKS_EMPTY_TMPL = "## Tasks with tag `{name}`\n\nNo tasks found."
+_TAG_TASKS_HEADER_TMPL = "## Tasks with tag `{name}` ({count} total)\n"
 
 
 class ListTagsInput(BaseModel):
     """Input for listing tags."""
-    pass
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
 
 class CreateTagInput(BaseModel):
     """Input for creating a tag."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore", frozen=True)
+
     name: str = Field(..., description="Tag name", min_length=1, max_length=50)
     color: Optional[str] = Field(
         default=None,
@@ -26,46 +57,51 @@ class CreateTagInput(BaseModel):
 
 class UpdateTagInput(BaseModel):
     """Input for updating a tag."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore", frozen=True)
+
     name: str = Field(..., description="Current tag name")
     new_name: Optional[str] = Field(default=None, max_length=50)
-    color: Optional[str] = Field(default=None)
+    color: Optional[str] = None
 
 
 class RenameTagInput(BaseModel):
     """Input for renaming a tag."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     old_name: str = Field(..., description="Current tag name")
     new_name: str = Field(..., description="New tag name", max_length=50)
 
 
 class MergeTagsInput(BaseModel):
     """Input for merging tags."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     source_tag: str = Field(..., description="Tag to merge from (will be deleted)")
     target_tag: str = Field(..., description="Tag to merge into (will remain)")
 
 
 class DeleteTagInput(BaseModel):
     """Input for deleting a tag."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str = Field(..., description="Tag name to delete")
 
 
 class GetTagTasksInput(BaseModel):
     """Input for getting tasks with a specific tag."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     tag_name: str = Field(..., description="Tag name")
     include_completed: bool = Field(default=False)
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: markdown, json, or compact (minified JSON)"
+    )
 
 
 def register_tag_tools(mcp, tag_service):
     """Register tag management tools (v2 API only)."""
 
-    @mcp.tool(
-        name="ticktick_list_tags",
-        annotations={
-            "title": "List TickTick Tags",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
     async def list_tags(params: ListTagsInput) -> str:
         """
         List all tags in your TickTick account.
@@ -77,17 +113,8 @@ def register_tag_tools(mcp, tag_service):
             tags = await tag_service.list()
             return tag_service.format_tag_list(tags)
         except Exception as e:
-            return f"**Error**: Failed to list tags - {str(e)}\n\n_Note: This feature requires v2 API authentication._"
-
-    @mcp.tool(
-        name="ticktick_create_tag",
-        annotations={
-            "title": "Create TickTick Tag",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": False,
-        }
-    )
+            return format_error("Failed to list tags", e, v2=True)
+
     async def create_tag(params: CreateTagInput) -> str:
         """
         Create a new tag.
@@ -95,67 +122,45 @@ def register_tag_tools(mcp, tag_service):
         Tags can be nested by specifying a parent tag name.
         Requires v2 API authentication.
         """
-        from ..models.tags import TagCreate
-
-        tag_data = TagCreate(
+        # params is already validated; skip a second validation pass
+        tag_data = TagCreate.model_construct(
             name=params.name,
             color=params.color,
-            parent_name=params.parent_name,
+            parent=params.parent_name,
         )
 
         try:
             tag = await tag_service.create(tag_data)
-            return f"""## Tag Created
-
-- **Name**: {tag.name}
-- **Color**: {tag.color or 'default'}
-- **Parent**: {tag.parent or 'none'}
-"""
+            return _TAG_CREATED_TMPL.format_map({
+                "name": tag.name,
+                "color": tag.color or "default",
+                "parent": tag.parent or "none",
+            })
         except Exception as e:
-            return f"**Error**: Failed to create tag - {str(e)}\n\n_Note: This feature requires v2 API authentication._"
-
-    @mcp.tool(
-        name="ticktick_update_tag",
-        annotations={
-            "title": "Update TickTick Tag",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to create tag", e, v2=True)
+
     async def update_tag(params: UpdateTagInput) -> str:
         """
         Update a tag's properties (color, etc.).
 
         Requires v2 API authentication.
         """
-        from ..models.tags import TagUpdate
-
-        update_data = TagUpdate(
+        update_data = TagUpdate.model_construct(
             name=params.name,
-            new_name=params.new_name,
             color=params.color,
         )
 
         try:
             tag = await tag_service.update(update_data)
-            return f"""## Tag Updated
-
-- **Name**: {tag.name}
-- **Color**: {tag.color or 'default'}
-"""
+            if params.new_name:
+                tag = await tag_service.rename(params.name, params.new_name) or tag
+            return _TAG_UPDATED_TMPL.format_map({
+                "name": tag.name,
+                "color": tag.color or "default",
+            })
         except Exception as e:
-            return f"**Error**: Failed to update tag - {str(e)}\n\n_Note: This feature requires v2 API authentication._"
-
-    @mcp.tool(
-        name="ticktick_rename_tag",
-        annotations={
-            "title": "Rename TickTick Tag",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to update tag", e, v2=True)
+
     async def rename_tag(params: RenameTagInput) -> str:
         """
         Rename a tag.
@@ -165,25 +170,13 @@ def register_tag_tools(mcp, tag_service):
         """
         try:
             await tag_service.rename(params.old_name, params.new_name)
-            return f"""## Tag Renamed
-
-- **Old Name**: {params.old_name}
-- **New Name**: {params.new_name}
-
-All tasks have been updated.
-"""
+            return _TAG_RENAMED_TMPL.format_map({
+                "old_name": params.old_name,
+                "new_name": params.new_name,
+            })
         except Exception as e:
-            return f"**Error**: Failed to rename tag - {str(e)}\n\n_Note: This feature requires v2 API authentication._"
-
-    @mcp.tool(
-        name="ticktick_merge_tags",
-        annotations={
-            "title": "Merge TickTick Tags",
-            "readOnlyHint": False,
-            "destructiveHint": True,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to rename tag", e, v2=True)
+
     async def merge_tags(params: MergeTagsInput) -> str:
         """
         Merge one tag into another.
@@ -193,24 +186,13 @@ All tasks have been updated.
         """
         try:
             await tag_service.merge(params.source_tag, params.target_tag)
-            return f"""## Tags Merged
-
-- **Merged**: `{params.source_tag}` → `{params.target_tag}`
-- The source tag has been deleted
-- All tasks now use the target tag
-"""
+            return _TAGS_MERGED_TMPL.format_map({
+                "source": params.source_tag,
+                "target": params.target_tag,
+            })
         except Exception as e:
-            return f"**Error**: Failed to merge tags - {str(e)}\n\n_Note: This feature requires v2 API authentication._"
-
-    @mcp.tool(
-        name="ticktick_delete_tag",
-        annotations={
-            "title": "Delete TickTick Tag",
-            "readOnlyHint": False,
-            "destructiveHint": True,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to merge tags", e, v2=True)
+
     async def delete_tag(params: DeleteTagInput) -> str:
         """
         Delete a tag.
@@ -220,19 +202,10 @@ All tasks have been updated.
         """
         try:
             await tag_service.delete(params.name)
-            return f"## Tag Deleted\n\nTag `{params.name}` has been deleted and removed from all tasks."
+            return _TAG_DELETED_TMPL.format_map({"name": params.name})
         except Exception as e:
-            return f"**Error**: Failed to delete tag - {str(e)}\n\n_Note: This feature requires v2 API authentication._"
-
-    @mcp.tool(
-        name="ticktick_get_tag_tasks",
-        annotations={
-            "title": "Get Tasks by Tag",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to delete tag", e, v2=True)
+
     async def get_tag_tasks(params: GetTagTasksInput) -> str:
         """
         Get all tasks that have a specific tag.
@@ -241,16 +214,32 @@ All tasks have been updated.
         """
         try:
             tasks = await tag_service.get_tasks_by_tag(params.tag_name)
+            if params.response_format is not ResponseFormat.MARKDOWN:
+                return tag_service.format_task_list_json(
+                    tasks, compact=params.response_format is ResponseFormat.COMPACT
+                )
             if not tasks:
-                return f"## Tasks with tag `{params.tag_name}`\n\nNo tasks found."
-
-            lines = [f"## Tasks with tag `{params.tag_name}` ({len(tasks)} total)\n"]
-            for task in tasks:
-                status = "✅" if task.status == 2 else "⬜"
-                lines.append(f"- {status} **{task.title}** (`{task.id}`)")
-                if task.due_date:
-                    lines.append(f"  - Due: {task.due_date}")
-
-            return "\n".join(lines)
+                return _TAG_TASKS_EMPTY_TMPL.format_map({"name": params.tag_name})
+
+            header = _TAG_TASKS_HEADER_TMPL.format_map({
+                "name": params.tag_name,
+                "count": len(tasks),
+            })
+            body = "\n".join(
+                f"- {_STATUS_EMOJI.get(task.status, '⬜')} **{task.title}** (`{task.id}`)"
+                + (f"\n  - Due: {task.due_date}" if task.due_date else "")
+                for task in tasks
+            )
+            return f"{header}\n{body}"
         except Exception as e:
-            return f"**Error**: Failed to get tasks - {str(e)}\n\n_Note: This feature requires v2 API authentication._"
+            return format_error("Failed to get tasks", e, v2=True)
+
+    register_tools(mcp, [
+        (list_tags, "ticktick_list_tags", {"title": "List TickTick Tags", **READ_ONLY}),
+        (create_tag, "ticktick_create_tag", {"title": "Create TickTick Tag", **WRITE_CREATE}),
+        (update_tag, "ticktick_update_tag", {"title": "Update TickTick Tag", **WRITE_IDEMPOTENT}),
+        (rename_tag, "ticktick_rename_tag", {"title": "Rename TickTick Tag", **WRITE_IDEMPOTENT}),
+        (merge_tags, "ticktick_merge_tags", {"title": "Merge TickTick Tags", **WRITE_DESTRUCTIVE}),
+        (delete_tag, "ticktick_delete_tag", {"title": "Delete TickTick Tag", **WRITE_DESTRUCTIVE}),
+        (get_tag_tasks, "ticktick_get_tag_tasks", {"title": "Get Tasks by Tag", **READ_ONLY}),
+    ])
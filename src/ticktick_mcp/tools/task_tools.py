@@ -3,13 +3,41 @@ Task MCP tools - CRUD, completion, and batch operations.
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
-
-from ..models.tasks import TaskPriority, ChecklistItem
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ..models.common import ResponseFormat
+from ..models.tasks import TaskPriority, ChecklistItem, TaskCreate, TaskUpdate
+from .common import (
+    READ_ONLY,
+    WRITE_CREATE,
+    WRITE_DESTRUCTIVE,
+    WRITE_IDEMPOTENT,
+    format_error,
+    register_tools,
+)
+
+_PRIORITY_NONE = TaskPriority.NONE
+
+# Response templates
+_TASK_CREATED_TMPL = "## Task Created\n\n{task}\n"
+_TASK_UPDATED_TMPL = "## Task Updated\n\n{task}\n"
+_TASK_COMPLETED_TMPL = "## Task Completed\n\nTask `{task_id}` has been marked as complete."
+_TASK_REOPENED_TMPL = "## Task Reopened\n\n{task}\n"
+_TASK_DELETED_TMPL = "## Task Deleted\n\nTask `{task_id}` has been permanently deleted."
+_TASK_MOVED_TMPL = "## Task Moved\n\nTask moved to project `{project_id}`.\n\n{task}\n"
+_SUBTASK_CREATED_TMPL = "## Subtask Created\n\nParent: `{parent_id}`\n\n{task}\n"
+_NO_COMPLETED_TASKS = (
+    "## Completed Tasks\n\nNo completed tasks found for the specified criteria."
+    "\n\n_Note: This feature requires v2 API authentication._"
+)
+_BATCH_CREATED_TMPL = "## Batch Task Creation\n\nSuccessfully created {count} tasks.\n\n{tasks}\n"
+_BATCH_DELETED_TMPL = "## Batch Deletion Complete\n\nSuccessfully deleted {count} tasks."
 
 
 class ListTasksInput(BaseModel):
     """Input for listing tasks."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     project_id: Optional[str] = Field(
         default=None,
         description="Filter by project ID (None for all projects)"
@@ -30,18 +58,30 @@ class ListTasksInput(BaseModel):
         default=None,
         description="Search in task titles and content"
     )
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: markdown, json, or compact (minified JSON)"
+    )
 
 
 class GetTaskInput(BaseModel):
     """Input for getting a specific task."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     task_id: str = Field(..., description="Task ID")
     project_id: str = Field(..., description="Project ID containing the task")
 
 
 class CreateTaskInput(BaseModel):
     """Input for creating a task."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore", frozen=True)
+
     title: str = Field(..., description="Task title", min_length=1, max_length=500)
-    content: Optional[str] = Field(default=None, description="Task description/notes")
+    content: Optional[str] = Field(
+        default=None,
+        description="Task description/notes",
+        max_length=5000
+    )
     project_id: Optional[str] = Field(
         default=None,
         description="Project/list ID (empty for inbox)"
@@ -60,7 +100,8 @@ class CreateTaskInput(BaseModel):
     )
     tags: Optional[list[str]] = Field(
         default=None,
-        description="Tags to add to the task"
+        description="Tags to add to the task",
+        max_length=20
     )
     is_all_day: bool = Field(default=True, description="Is all-day task")
     time_zone: Optional[str] = Field(default=None, description="Time zone")
@@ -74,41 +115,57 @@ class CreateTaskInput(BaseModel):
         ge=0
     )
 
+    @field_validator("tags")
+    @classmethod
+    def validate_tags(cls, v: Optional[list[str]]) -> Optional[list[str]]:
+        """Validate tag names."""
+        return TaskCreate.validate_tags(v)
+
 
 class UpdateTaskInput(BaseModel):
     """Input for updating a task."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore", frozen=True)
+
     task_id: str = Field(..., description="Task ID to update")
     project_id: str = Field(..., description="Project ID containing the task")
     title: Optional[str] = Field(default=None, max_length=500)
-    content: Optional[str] = Field(default=None)
-    due_date: Optional[str] = Field(default=None)
-    start_date: Optional[str] = Field(default=None)
-    priority: Optional[str] = Field(default=None)
-    tags: Optional[list[str]] = Field(default=None)
-    is_all_day: Optional[bool] = Field(default=None)
+    content: Optional[str] = Field(default=None, max_length=5000)
+    due_date: Optional[str] = None
+    start_date: Optional[str] = None
+    priority: Optional[str] = None
+    tags: Optional[list[str]] = None
+    is_all_day: Optional[bool] = None
     pomo_estimated: Optional[int] = Field(default=None, ge=0)
 
 
 class CompleteTaskInput(BaseModel):
     """Input for completing a task."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     task_id: str = Field(..., description="Task ID to complete")
     project_id: str = Field(..., description="Project ID containing the task")
 
 
 class UncompleteTaskInput(BaseModel):
     """Input for reopening a completed task."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     task_id: str = Field(..., description="Task ID to uncomplete")
     project_id: str = Field(..., description="Project ID containing the task")
 
 
 class DeleteTaskInput(BaseModel):
     """Input for deleting a task."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     task_id: str = Field(..., description="Task ID to delete")
     project_id: str = Field(..., description="Project ID containing the task")
 
 
 class MoveTaskInput(BaseModel):
     """Input for moving a task between projects."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     task_id: str = Field(..., description="Task ID to move")
     from_project_id: str = Field(..., description="Source project ID")
     to_project_id: str = Field(..., description="Destination project ID")
@@ -116,16 +173,20 @@ class MoveTaskInput(BaseModel):
 
 class CreateSubtaskInput(BaseModel):
     """Input for creating a subtask."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore", frozen=True)
+
     parent_task_id: str = Field(..., description="Parent task ID")
     project_id: str = Field(..., description="Project ID")
-    title: str = Field(..., description="Subtask title")
-    content: Optional[str] = Field(default=None)
-    due_date: Optional[str] = Field(default=None)
+    title: str = Field(..., description="Subtask title", min_length=1, max_length=500)
+    content: Optional[str] = Field(default=None, max_length=5000)
+    due_date: Optional[str] = None
     priority: Optional[str] = Field(default="none")
 
 
 class GetCompletedTasksInput(BaseModel):
     """Input for getting completed tasks (v2 only)."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     from_date: Optional[str] = Field(
         default=None,
         description="Start date (YYYY-MM-DD)"
@@ -134,12 +195,18 @@ class GetCompletedTasksInput(BaseModel):
         default=None,
         description="End date (YYYY-MM-DD)"
     )
-    project_id: Optional[str] = Field(default=None)
+    project_id: Optional[str] = None
     limit: int = Field(default=50, ge=1, le=100)
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: markdown, json, or compact (minified JSON)"
+    )
 
 
 class BatchCreateTasksInput(BaseModel):
     """Input for batch task creation."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     tasks: list[CreateTaskInput] = Field(
         ...,
         description="List of tasks to create",
@@ -150,6 +217,8 @@ class BatchCreateTasksInput(BaseModel):
 
 class BatchDeleteTasksInput(BaseModel):
     """Input for batch task deletion."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     tasks: list[dict] = Field(
         ...,
         description="List of {task_id, project_id} to delete",
@@ -161,45 +230,28 @@ class BatchDeleteTasksInput(BaseModel):
 def register_task_tools(mcp, task_service):
     """Register task management tools."""
 
-    @mcp.tool(
-        name="ticktick_list_tasks",
-        annotations={
-            "title": "List TickTick Tasks",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
     async def list_tasks(params: ListTasksInput) -> str:
         """
         List tasks with optional filtering.
 
         Supports filtering by project, priority, tags, and search query.
+        Set response_format to "json" for structured output.
         """
-        filters = {}
-        if params.priority:
-            filters["priority"] = TaskPriority.from_string(params.priority)
-        if params.tags:
-            filters["tags"] = params.tags
-        if params.search_query:
-            filters["search_query"] = params.search_query
-
+        # TickTick has no server-side task filtering; unset filters are
+        # dropped in the service so no TaskFilter is built for plain listings
         tasks = await task_service.list(
             project_id=params.project_id,
             include_completed=params.include_completed,
-            **filters
+            priority=TaskPriority.from_string(params.priority) if params.priority else None,
+            tags=params.tags or None,
+            search_query=params.search_query or None,
         )
+        if params.response_format is not ResponseFormat.MARKDOWN:
+            return task_service.format_task_list_json(
+                tasks, compact=params.response_format is ResponseFormat.COMPACT
+            )
         return task_service.format_task_list(tasks)
 
-    @mcp.tool(
-        name="ticktick_get_task",
-        annotations={
-            "title": "Get TickTick Task",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
     async def get_task(params: GetTaskInput) -> str:
         """
         Get a specific task by ID.
@@ -210,17 +262,8 @@ def register_task_tools(mcp, task_service):
             task = await task_service.get(params.task_id, params.project_id)
             return task_service.format_task(task)
         except Exception as e:
-            return f"**Error**: Could not find task - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_create_task",
-        annotations={
-            "title": "Create TickTick Task",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": False,
-        }
-    )
+            return format_error("Could not find task", e)
+
     async def create_task(params: CreateTaskInput) -> str:
         """
         Create a new task in TickTick.
@@ -228,15 +271,14 @@ def register_task_tools(mcp, task_service):
         Can set title, description, due date, priority, tags, and more.
         If project_id is not provided, task goes to inbox.
         """
-        from ..models.tasks import TaskCreate
-
-        task_data = TaskCreate(
+        # params is already validated; skip a second validation pass
+        task_data = TaskCreate.model_construct(
             title=params.title,
             content=params.content,
             project_id=params.project_id,
             due_date=params.due_date,
             start_date=params.start_date,
-            priority=TaskPriority.from_string(params.priority or "none"),
+            priority=TaskPriority.from_string(params.priority) if params.priority else _PRIORITY_NONE,
             tags=params.tags,
             is_all_day=params.is_all_day,
             time_zone=params.time_zone,
@@ -246,31 +288,17 @@ def register_task_tools(mcp, task_service):
 
         try:
             task = await task_service.create(task_data)
-            return f"""## Task Created
-
-{task_service.format_task(task)}
-"""
+            return _TASK_CREATED_TMPL.format_map({"task": task_service.format_task(task)})
         except Exception as e:
-            return f"**Error**: Failed to create task - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_update_task",
-        annotations={
-            "title": "Update TickTick Task",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to create task", e)
+
     async def update_task(params: UpdateTaskInput) -> str:
         """
         Update an existing task.
 
         Only provided fields will be updated.
         """
-        from ..models.tasks import TaskUpdate
-
-        update_data = TaskUpdate(
+        update_data = TaskUpdate.model_construct(
             id=params.task_id,
             project_id=params.project_id,
             title=params.title,
@@ -285,63 +313,30 @@ def register_task_tools(mcp, task_service):
 
         try:
             task = await task_service.update(update_data)
-            return f"""## Task Updated
-
-{task_service.format_task(task)}
-"""
+            return _TASK_UPDATED_TMPL.format_map({"task": task_service.format_task(task)})
         except Exception as e:
-            return f"**Error**: Failed to update task - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_complete_task",
-        annotations={
-            "title": "Complete TickTick Task",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to update task", e)
+
     async def complete_task(params: CompleteTaskInput) -> str:
         """
         Mark a task as complete.
         """
         try:
             await task_service.complete(params.task_id, params.project_id)
-            return f"## Task Completed\n\nTask `{params.task_id}` has been marked as complete."
+            return _TASK_COMPLETED_TMPL.format_map({"task_id": params.task_id})
         except Exception as e:
-            return f"**Error**: Failed to complete task - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_uncomplete_task",
-        annotations={
-            "title": "Uncomplete TickTick Task",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to complete task", e)
+
     async def uncomplete_task(params: UncompleteTaskInput) -> str:
         """
         Reopen a completed task (mark as incomplete).
         """
         try:
             task = await task_service.uncomplete(params.task_id, params.project_id)
-            return f"""## Task Reopened
-
-{task_service.format_task(task)}
-"""
+            return _TASK_REOPENED_TMPL.format_map({"task": task_service.format_task(task)})
         except Exception as e:
-            return f"**Error**: Failed to uncomplete task - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_delete_task",
-        annotations={
-            "title": "Delete TickTick Task",
-            "readOnlyHint": False,
-            "destructiveHint": True,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to uncomplete task", e)
+
     async def delete_task(params: DeleteTaskInput) -> str:
         """
         Delete a task permanently.
@@ -350,19 +345,10 @@ def register_task_tools(mcp, task_service):
         """
         try:
             await task_service.delete(params.task_id, params.project_id)
-            return f"## Task Deleted\n\nTask `{params.task_id}` has been permanently deleted."
+            return _TASK_DELETED_TMPL.format_map({"task_id": params.task_id})
         except Exception as e:
-            return f"**Error**: Failed to delete task - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_move_task",
-        annotations={
-            "title": "Move TickTick Task",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to delete task", e)
+
     async def move_task(params: MoveTaskInput) -> str:
         """
         Move a task to a different project/list.
@@ -373,38 +359,25 @@ def register_task_tools(mcp, task_service):
                 params.from_project_id,
                 params.to_project_id
             )
-            return f"""## Task Moved
-
-Task moved to project `{params.to_project_id}`.
-
-{task_service.format_task(task)}
-"""
+            return _TASK_MOVED_TMPL.format_map({
+                "project_id": params.to_project_id,
+                "task": task_service.format_task(task),
+            })
         except Exception as e:
-            return f"**Error**: Failed to move task - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_create_subtask",
-        annotations={
-            "title": "Create Subtask",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": False,
-        }
-    )
+            return format_error("Failed to move task", e)
+
     async def create_subtask(params: CreateSubtaskInput) -> str:
         """
         Create a subtask under a parent task.
 
         Note: Requires v2 API for full hierarchy support.
         """
-        from ..models.tasks import TaskCreate
-
-        task_data = TaskCreate(
+        task_data = TaskCreate.model_construct(
             title=params.title,
             content=params.content,
             project_id=params.project_id,
             due_date=params.due_date,
-            priority=TaskPriority.from_string(params.priority or "none"),
+            priority=TaskPriority.from_string(params.priority) if params.priority else _PRIORITY_NONE,
         )
 
         try:
@@ -413,24 +386,13 @@ Task moved to project `{params.to_project_id}`.
                 params.project_id,
                 task_data
             )
-            return f"""## Subtask Created
-
-Parent: `{params.parent_task_id}`
-
-{task_service.format_task(subtask)}
-"""
+            return _SUBTASK_CREATED_TMPL.format_map({
+                "parent_id": params.parent_task_id,
+                "task": task_service.format_task(subtask),
+            })
         except Exception as e:
-            return f"**Error**: Failed to create subtask - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_get_completed_tasks",
-        annotations={
-            "title": "Get Completed Tasks",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Failed to create subtask", e)
+
     async def get_completed_tasks(params: GetCompletedTasksInput) -> str:
         """
         Get completed tasks within a date range.
@@ -444,63 +406,46 @@ Parent: `{params.parent_task_id}`
                 project_id=params.project_id,
                 limit=params.limit
             )
+            if params.response_format is not ResponseFormat.MARKDOWN:
+                return task_service.format_task_list_json(
+                    tasks, compact=params.response_format is ResponseFormat.COMPACT
+                )
             if not tasks:
-                return "## Completed Tasks\n\nNo completed tasks found for the specified criteria.\n\n_Note: This feature requires v2 API authentication._"
+                return _NO_COMPLETED_TASKS
             return task_service.format_task_list(tasks, title="Completed Tasks")
         except Exception as e:
-            return f"**Error**: Failed to get completed tasks - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_batch_create_tasks",
-        annotations={
-            "title": "Batch Create Tasks",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": False,
-        }
-    )
+            return format_error("Failed to get completed tasks", e)
+
     async def batch_create_tasks(params: BatchCreateTasksInput) -> str:
         """
         Create multiple tasks in a single request.
 
         More efficient than creating tasks one by one.
         """
-        from ..models.tasks import TaskCreate
-
-        task_creates = []
-        for t in params.tasks:
-            task_creates.append(TaskCreate(
+        task_creates = [
+            TaskCreate.model_construct(
                 title=t.title,
                 content=t.content,
                 project_id=t.project_id,
                 due_date=t.due_date,
                 start_date=t.start_date,
-                priority=TaskPriority.from_string(t.priority or "none"),
+                priority=TaskPriority.from_string(t.priority) if t.priority else _PRIORITY_NONE,
                 tags=t.tags,
                 is_all_day=t.is_all_day,
                 time_zone=t.time_zone,
-            ))
+            )
+            for t in params.tasks
+        ]
 
         try:
             tasks = await task_service.batch_create(task_creates)
-            return f"""## Batch Task Creation
-
-Successfully created {len(tasks)} tasks.
-
-{task_service.format_task_list(tasks, title="Created Tasks")}
-"""
+            return _BATCH_CREATED_TMPL.format_map({
+                "count": len(tasks),
+                "tasks": task_service.format_task_list(tasks, title="Created Tasks"),
+            })
         except Exception as e:
-            return f"**Error**: Batch creation failed - {str(e)}"
-
-    @mcp.tool(
-        name="ticktick_batch_delete_tasks",
-        annotations={
-            "title": "Batch Delete Tasks",
-            "readOnlyHint": False,
-            "destructiveHint": True,
-            "idempotentHint": True,
-        }
-    )
+            return format_error("Batch creation failed", e)
+
     async def batch_delete_tasks(params: BatchDeleteTasksInput) -> str:
         """
         Delete multiple tasks in a single request.
@@ -509,6 +454,21 @@ Successfully created {len(tasks)} tasks.
         """
         try:
             await task_service.batch_delete(params.tasks)
-            return f"## Batch Deletion Complete\n\nSuccessfully deleted {len(params.tasks)} tasks."
+            return _BATCH_DELETED_TMPL.format_map({"count": len(params.tasks)})
         except Exception as e:
-            return f"**Error**: Batch deletion failed - {str(e)}"
+            return format_error("Batch deletion failed", e)
+
+    register_tools(mcp, [
+        (list_tasks, "ticktick_list_tasks", {"title": "List TickTick Tasks", **READ_ONLY}),
+        (get_task, "ticktick_get_task", {"title": "Get TickTick Task", **READ_ONLY}),
+        (create_task, "ticktick_create_task", {"title": "Create TickTick Task", **WRITE_CREATE}),
+        (update_task, "ticktick_update_task", {"title": "Update TickTick Task", **WRITE_IDEMPOTENT}),
+        (complete_task, "ticktick_complete_task", {"title": "Complete TickTick Task", **WRITE_IDEMPOTENT}),
+        (uncomplete_task, "ticktick_uncomplete_task", {"title": "Uncomplete TickTick Task", **WRITE_IDEMPOTENT}),
+        (delete_task, "ticktick_delete_task", {"title": "Delete TickTick Task", **WRITE_DESTRUCTIVE}),
+        (move_task, "ticktick_move_task", {"title": "Move TickTick Task", **WRITE_IDEMPOTENT}),
+        (create_subtask, "ticktick_create_subtask", {"title": "Create Subtask", **WRITE_CREATE}),
+        (get_completed_tasks, "ticktick_get_completed_tasks", {"title": "Get Completed Tasks", **READ_ONLY}),
+        (batch_create_tasks, "ticktick_batch_create_tasks", {"title": "Batch Create Tasks", **WRITE_CREATE}),
+        (batch_delete_tasks, "ticktick_batch_delete_tasks", {"title": "Batch Delete Tasks", **WRITE_DESTRUCTIVE}),
+    ])
@@ -3,25 +3,48 @@ Pytest configuration and fixtures for TickTick MCP tests.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+from ticktick_mcp.api.client import TickTickClient
+
+
+def pytest_addoption(parser):
+    """Add the --fast option."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip tests marked io or slow",
+    )
+
+
+def pytest_configure(config):
+    """Apply --fast as a marker expression unless -m was given."""
+    if config.getoption("--fast") and not config.option.markexpr:
+        config.option.markexpr = "not io and not slow"
+
+
+@pytest.fixture(scope="session")
+def _mock_client_proto():
+    """Build the mock client tree once per session."""
+    # The spec turns coroutine methods (get/post/put/delete, authorize_oauth,
+    # ...) into AsyncMocks and rejects attributes the real client lacks
+    return MagicMock(spec=TickTickClient)
 
 
 @pytest.fixture
-def mock_client():
+def mock_client(_mock_client_proto):
     """Create a mock TickTick API client."""
-    client = MagicMock()
+    client = _mock_client_proto
     client.is_authenticated = False
     client._oauth_token = None
     client._session_token = None
     client.inbox_id = None
 
-    # Mock async methods
-    client.get = AsyncMock()
-    client.post = AsyncMock()
-    client.put = AsyncMock()
-    client.delete = AsyncMock()
+    yield client
 
-    return client
+    client.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
@@ -42,10 +65,10 @@ def v2_authenticated_client(authenticated_client):
     return authenticated_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_task():
     """Sample task data."""
-    return {
+    return MappingProxyType({
         "id": "task123",
         "projectId": "project456",
         "title": "Test Task",
@@ -55,37 +78,37 @@ def sample_task():
         "tags": ["work", "important"],
         "dueDate": "2024-12-31T23:59:59+0000",
         "createdTime": "2024-01-01T00:00:00+0000",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project():
     """Sample project data."""
-    return {
+    return MappingProxyType({
         "id": "project456",
         "name": "Test Project",
         "color": "#FF5733",
         "sortOrder": 0,
         "closed": False,
         "viewMode": "list",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tag():
     """Sample tag data."""
-    return {
+    return MappingProxyType({
         "name": "work",
         "color": "#0066FF",
         "sortOrder": 0,
         "parent": None,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_habit():
     """Sample habit data."""
-    return {
+    return MappingProxyType({
         "id": "habit789",
         "name": "Exercise",
         "goal": 1,
@@ -93,13 +116,13 @@ def sample_habit():
         "color": "#00FF00",
         "status": 1,
         "targetDays": "1234567",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_focus_record():
     """Sample focus record data."""
-    return {
+    return MappingProxyType({
         "id": "focus001",
         "focusType": "pomo",
         "duration": 1500,  # 25 minutes in seconds
@@ -107,4 +130,4 @@ def sample_focus_record():
         "endTime": "2024-01-01T10:25:00+0000",
         "taskId": "task123",
         "taskTitle": "Test Task",
-    }
+    })
@@ -2,12 +2,10 @@
 Tests for TickTick MCP configuration management.
 """
 
-import os
 import json
-import tempfile
 import pytest
-from pathlib import Path
 
+from ticktick_mcp import config as config_module
 from ticktick_mcp.config import TickTickConfig, OAuthConfig, ServerConfig, APIConfig
 
 
@@ -36,7 +34,8 @@ class TestTickTickConfig:
         assert config.oauth.client_secret == "env_client_secret"
         assert config.server.log_level == "DEBUG"
 
-    def test_from_file(self):
+    @pytest.mark.io
+    def test_from_file(self, tmp_path):
         """Test loading configuration from JSON file."""
         config_data = {
             "oauth": {
@@ -55,20 +54,36 @@ class TestTickTickConfig:
             },
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
+        temp_path = tmp_path / "config.json"
+        temp_path.write_text(json.dumps(config_data))
 
-        try:
-            config = TickTickConfig.from_file(temp_path)
+        config = TickTickConfig.from_file(str(temp_path))
 
-            assert config.oauth.client_id == "file_client_id"
-            assert config.oauth.redirect_uri == "http://custom.redirect/callback"
-            assert config.server.name == "custom-mcp"
-            assert config.server.cache_enabled is False
-            assert config.api.timeout == 60
-        finally:
-            os.unlink(temp_path)
+        assert config.oauth.client_id == "file_client_id"
+        assert config.oauth.redirect_uri == "http://custom.redirect/callback"
+        assert config.server.name == "custom-mcp"
+        assert config.server.cache_enabled is False
+        assert config.api.timeout == 60
+
+    @pytest.mark.io
+    def test_from_file_cached_until_modified(self, tmp_path, monkeypatch):
+        """Test config file parses are reused until the file changes."""
+        config_module.clear_config_cache()
+        temp_path = tmp_path / "config.json"
+        temp_path.write_text(json.dumps({"oauth": {"client_id": "first"}}))
+
+        loads = []
+        real_loads = config_module._json.loads
+        monkeypatch.setattr(config_module._json, "loads", lambda raw: loads.append(1) or real_loads(raw))
+
+        assert TickTickConfig.from_file(str(temp_path)).oauth.client_id == "first"
+        assert TickTickConfig.from_file(str(temp_path)).oauth.client_id == "first"
+        assert len(loads) == 1
+
+        temp_path.write_text(json.dumps({"oauth": {"client_id": "second_id"}}))
+
+        assert TickTickConfig.from_file(str(temp_path)).oauth.client_id == "second_id"
+        assert len(loads) == 2
 
     def test_from_file_not_found(self):
         """Test loading from non-existent file returns defaults."""
@@ -78,7 +93,8 @@ class TestTickTickConfig:
         assert config.oauth.client_id is None
         assert config.server.name == "ticktick-mcp"
 
-    def test_load_env_priority(self, monkeypatch):
+    @pytest.mark.io
+    def test_load_env_priority(self, monkeypatch, tmp_path):
         """Test that environment variables override file config."""
         config_data = {
             "oauth": {
@@ -86,20 +102,16 @@ class TestTickTickConfig:
             },
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
+        temp_path = tmp_path / "config.json"
+        temp_path.write_text(json.dumps(config_data))
 
         # Set environment variable to override
         monkeypatch.setenv("TICKTICK_CLIENT_ID", "env_override_id")
 
-        try:
-            config = TickTickConfig.load(temp_path)
+        config = TickTickConfig.load(str(temp_path))
 
-            # Environment should override file
-            assert config.oauth.client_id == "env_override_id"
-        finally:
-            os.unlink(temp_path)
+        # Environment should override file
+        assert config.oauth.client_id == "env_override_id"
 
     def test_to_dict(self):
         """Test converting config to dictionary."""
@@ -113,27 +125,26 @@ class TestTickTickConfig:
         # Secret should be masked
         assert data["oauth"]["client_secret"] == "***"
 
-    def test_save(self):
+    @pytest.mark.io
+    def test_save(self, tmp_path):
         """Test saving configuration to file."""
         config = TickTickConfig()
         config.oauth.client_id = "save_test_id"
         config.server.log_level = "DEBUG"
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            config.save(str(config_path))
+        config_path = tmp_path / "config.json"
+        config.save(str(config_path))
 
-            # Verify file was created
-            assert config_path.exists()
+        # Verify file was created
+        assert config_path.exists()
 
-            # Load and verify contents
-            with open(config_path) as f:
-                data = json.load(f)
+        # Load and verify contents
+        data = json.loads(config_path.read_text())
 
-            assert data["oauth"]["client_id"] == "save_test_id"
-            assert data["server"]["log_level"] == "DEBUG"
-            # Secret should not be saved
-            assert data["oauth"]["client_secret"] is None
+        assert data["oauth"]["client_id"] == "save_test_id"
+        assert data["server"]["log_level"] == "DEBUG"
+        # Secret should not be saved
+        assert data["oauth"]["client_secret"] is None
 
 
 class TestOAuthConfig:
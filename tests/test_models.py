@@ -13,7 +13,7 @@ from ticktick_mcp.models.tasks import (
     TaskStatus,
     ChecklistItem,
 )
-from ticktick_mcp.models.projects import Project, ProjectCreate
+from ticktick_mcp.models.projects import Project, ProjectCreate, ProjectViewMode
 from ticktick_mcp.models.auth import OAuthToken, SessionToken
 
 
@@ -24,20 +24,45 @@ class TestTaskModels:
         """Test creating a Task from API response."""
         task = Task(**sample_task)
 
-        assert task.id == "task123"
-        assert task.project_id == "project456"
-        assert task.title == "Test Task"
-        assert task.status == TaskStatus.INCOMPLETE
-        assert task.priority == TaskPriority.MEDIUM
-        assert task.tags == ["work", "important"]
+        expected = Task.model_construct(
+            id="task123",
+            project_id="project456",
+            title="Test Task",
+            content="Task description",
+            status=TaskStatus.INCOMPLETE,
+            priority=TaskPriority.MEDIUM,
+            tags=["work", "important"],
+            due_date="2024-12-31T23:59:59+0000",
+            created_time="2024-01-01T00:00:00+0000",
+        )
+        assert task == expected
+
+    def test_task_from_api_matches_validation(self, sample_task):
+        """Test the unvalidated API fast path builds the same Task."""
+        task = Task.from_api(sample_task)
+
+        assert task == Task(**sample_task)
+        assert task.priority is TaskPriority.MEDIUM
+
+    def test_task_from_api_falls_back_to_validation(self):
+        """Test incomplete API payloads are still validated."""
+        with pytest.raises(ValidationError):
+            Task.from_api({"id": "task123", "title": "No project"})
+
+    def test_task_from_api_rejects_null_required_field(self, sample_task):
+        """Test a null required field is validated rather than constructed."""
+        with pytest.raises(ValidationError):
+            Task.from_api({**sample_task, "projectId": None})
 
     def test_task_create_minimal(self):
         """Test creating a task with minimal data."""
         task = TaskCreate(title="Simple Task")
 
-        assert task.title == "Simple Task"
-        assert task.project_id is None
-        assert task.priority == TaskPriority.NONE
+        assert task == TaskCreate.model_construct(
+            title="Simple Task",
+            project_id=None,
+            priority=TaskPriority.NONE,
+        )
 
     def test_task_create_full(self):
         """Test creating a task with all fields."""
@@ -50,10 +75,15 @@ class TestTaskModels:
             tags=["urgent"],
         )
 
-        assert task.title == "Full Task"
-        assert task.content == "Description here"
-        assert task.project_id == "proj123"
-        assert task.priority == TaskPriority.HIGH
+        expected = TaskCreate.model_construct(
+            title="Full Task",
+            content="Description here",
+            project_id="proj123",
+            due_date="2024-12-31T23:59:59+0000",
+            priority=TaskPriority.HIGH,
+            tags=["urgent"],
+        )
+        assert task == expected
 
     def test_task_create_validation_empty_title(self):
         """Test that empty title raises validation error."""
@@ -75,6 +105,8 @@ class TestTaskModels:
         assert TaskPriority.from_string("low") == TaskPriority.LOW
         assert TaskPriority.from_string("none") == TaskPriority.NONE
         assert TaskPriority.from_string("invalid") == TaskPriority.NONE
+        assert TaskPriority.from_string("HIGH") is TaskPriority.HIGH
+        assert TaskPriority.from_string("Medium") is TaskPriority.MEDIUM
 
     def test_task_status_to_emoji(self):
         """Test status emoji conversion."""
@@ -96,9 +128,27 @@ class TestProjectModels:
         """Test creating a Project from API response."""
         project = Project(**sample_project)
 
-        assert project.id == "project456"
-        assert project.name == "Test Project"
-        assert project.color == "#FF5733"
+        expected = Project.model_construct(
+            id="project456",
+            name="Test Project",
+            color="#FF5733",
+            sort_order=0,
+            closed=False,
+            view_mode=ProjectViewMode.LIST,
+        )
+        assert project == expected
+
+    def test_project_from_api_matches_validation(self, sample_project):
+        """Test the unvalidated API fast path builds the same Project."""
+        project = Project.from_api(sample_project)
+
+        assert project == Project(**sample_project)
+        assert project.view_mode is ProjectViewMode.LIST
+
+    def test_project_from_api_rejects_null_required_field(self, sample_project):
+        """Test a null required field is validated rather than constructed."""
+        with pytest.raises(ValidationError):
+            Project.from_api({**sample_project, "name": None})
 
     def test_project_create_minimal(self):
         """Test creating a project with minimal data."""
@@ -147,3 +197,28 @@ class TestAuthModels:
         assert token.token == "session_token_value"
         assert token.user_id == "user123"
         assert token.inbox_id == "inbox456"
+
+
+class TestParsingHelpers:
+    """Tests for API payload parsing helpers."""
+
+    def test_parse_iso_datetime_compact_offset(self):
+        """Test TickTick's '+0000' offsets and 'Z' suffix parse the same."""
+        from ticktick_mcp._dates import parse_iso_datetime
+
+        expected = parse_iso_datetime("2024-12-31T23:59:59+00:00")
+
+        assert parse_iso_datetime("2024-12-31T23:59:59.000+0000") == expected
+        assert parse_iso_datetime("2024-12-31T23:59:59Z") == expected
+
+    def test_build_remap_renames_aliases_only(self):
+        """Test generated remappers rename aliases and keep other keys."""
+        from ticktick_mcp.models._remap import build_remap
+
+        remap = build_remap({"projectId": "project_id", "dueDate": "due_date"})
+
+        assert remap({"id": "t1", "projectId": "p1", "extra": 1}) == {
+            "id": "t1",
+            "project_id": "p1",
+            "extra": 1,
+        }
@@ -2,13 +2,17 @@
 Tests for TickTick MCP services.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
 from ticktick_mcp.services.task_service import TaskService
 from ticktick_mcp.services.project_service import ProjectService
 from ticktick_mcp.services.auth_service import AuthService
+from ticktick_mcp.services.focus_service import FocusService
 from ticktick_mcp.models.tasks import Task, TaskCreate, TaskPriority
+from ticktick_mcp.models.focus import PomoSettings
 
 
 class TestTaskService:
@@ -67,6 +71,51 @@ class TestTaskService:
 
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_list_all_projects(self, task_service, mock_client, sample_task, sample_project):
+        """Test listing tasks across all projects."""
+        other = {**sample_task, "id": "task789", "projectId": "project789"}
+
+        async def fake_get(url, **kwargs):
+            if url.endswith("project456/data"):
+                return {"tasks": [sample_task]}
+            if url.endswith("project789/data"):
+                return {"tasks": [other]}
+            return [sample_project, {**sample_project, "id": "project789"}]
+
+        mock_client.get.side_effect = fake_get
+
+        tasks = await task_service.list()
+
+        assert [t.id for t in tasks] == ["task123", "task789"]
+
+    @pytest.mark.asyncio
+    async def test_list_all_projects_bounded(self, task_service, mock_client, sample_task, sample_project):
+        """Test project fetches are capped and a failing project is skipped."""
+        projects = [{**sample_project, "id": f"project{i}"} for i in range(40)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(url, **kwargs):
+            nonlocal in_flight, peak
+            if not url.endswith("/data"):
+                return projects
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if url.endswith("project0/data"):
+                raise RuntimeError("boom")
+            project_id = url.rsplit("/", 2)[-2]
+            return {"tasks": [{**sample_task, "id": f"task-{project_id}", "projectId": project_id}]}
+
+        mock_client.get.side_effect = fake_get
+
+        tasks = await task_service.list()
+
+        assert peak <= 16
+        assert len(tasks) == 39
+
     def test_format_task(self, task_service, sample_task):
         """Test task formatting."""
         task = Task(**sample_task)
@@ -76,6 +125,17 @@ class TestTaskService:
         assert "task123" in formatted
         assert "Medium" in formatted
 
+    def test_format_task_list_json(self, task_service, sample_task):
+        """Test JSON task list formatting."""
+        import json
+
+        task = Task(**sample_task)
+        data = json.loads(task_service.format_task_list_json([task], compact=True))
+
+        assert data[0]["id"] == "task123"
+        assert data[0]["projectId"] == "project456"
+        assert data[0]["priority"] == 3
+
 
 class TestProjectService:
     """Tests for ProjectService."""
@@ -107,6 +167,56 @@ class TestProjectService:
         assert project.name == "Test Project"
 
 
+class TestFocusService:
+    """Tests for FocusService."""
+
+    @pytest.fixture
+    def focus_service(self, v2_authenticated_client):
+        """Create a FocusService instance."""
+        return FocusService(v2_authenticated_client)
+
+    @pytest.mark.asyncio
+    async def test_get_settings_cached(self, focus_service, mock_client):
+        """Test settings are cached until updated."""
+        mock_client.get.return_value = {"pomoDuration": 30}
+        mock_client.post.return_value = {"pomoDuration": 45}
+
+        first = await focus_service.get_settings()
+        second = await focus_service.get_settings()
+
+        assert first.pomo_duration == second.pomo_duration == 30
+        mock_client.get.assert_called_once()
+
+        await focus_service.update_settings(PomoSettings(pomo_duration=45))
+        updated = await focus_service.get_settings()
+
+        assert updated.pomo_duration == 45
+        mock_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_settings_not_overwritten_by_concurrent_read(self, focus_service, mock_client):
+        """Test a GET still in flight when the update lands does not re-cache old settings."""
+        release_get = asyncio.Event()
+
+        async def slow_get(*args, **kwargs):
+            await release_get.wait()
+            return {"pomoDuration": 30}
+
+        mock_client.get.side_effect = slow_get
+        mock_client.post.return_value = {"pomoDuration": 45}
+
+        read = asyncio.create_task(focus_service.get_settings())
+        await asyncio.sleep(0)
+        await focus_service.update_settings(PomoSettings(pomo_duration=45))
+        release_get.set()
+        stale = await read
+        settings = await focus_service.get_settings()
+
+        assert stale.pomo_duration == 30
+        assert settings.pomo_duration == 45
+        mock_client.get.assert_called_once()
+
+
 class TestAuthService:
     """Tests for AuthService."""
 
@@ -162,6 +272,22 @@ class TestAuthService:
 
         assert "Not Authenticated" in status
 
+    def test_sync_methods_do_not_start_event_loop(self, auth_service, mock_client, monkeypatch):
+        """Test sync wrappers never spin up an event loop."""
+        import asyncio
+
+        def fail(*args, **kwargs):
+            raise AssertionError("event loop created")
+
+        monkeypatch.setattr(asyncio, "run", fail)
+        monkeypatch.setattr(asyncio, "new_event_loop", fail)
+        mock_client.get_auth_status.return_value = {"is_authenticated": False}
+
+        auth_service.configure_oauth("client_id", "client_secret")
+        assert auth_service.is_authenticated is False
+        assert "Not Authenticated" in auth_service.format_status()
+        auth_service.logout()
+
     def test_logout(self, auth_service, mock_client):
         """Test logout."""
         auth_service.logout()
@@ -0,0 +1,277 @@
+"""
+Tests for the standalone ticktick_mcp.py server script.
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "ticktick_mcp.py"
+
+
+@pytest.fixture(scope="module")
+def script():
+    """Load the script under its own name; it shares a name with the package."""
+    spec = importlib.util.spec_from_file_location("ticktick_mcp_script", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def token_path(script, tmp_path, monkeypatch):
+    """Point the token cache at a temporary file and start with empty caches."""
+    path = str(tmp_path / "token.json")
+    monkeypatch.setattr(script, "_TOKEN_CACHE_PATH", path)
+    script.invalidate_tasks_cache()
+    yield path
+    script.invalidate_tasks_cache()
+
+
+class TestTodayCache:
+    """Tests for the cached today view."""
+
+    @pytest.mark.asyncio
+    async def test_token_change_drops_cached_today(self, script, token_path, monkeypatch):
+        """Test saving a new token forces today's tasks to be fetched again."""
+        calls = []
+
+        async def fake_schedule(params):
+            calls.append(params)
+            return f"schedule #{len(calls)}"
+
+        monkeypatch.setattr(script, "_build_schedule", fake_schedule)
+
+        assert await script.ticktick_get_today() == "schedule #1"
+        assert await script.ticktick_get_today() == "schedule #1"
+        assert len(calls) == 1
+
+        await script.save_token({"access_token": "other-account"})
+
+        assert await script.ticktick_get_today() == "schedule #2"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_render_is_not_overwritten(self, script, token_path, monkeypatch):
+        """Test a write landing mid-render keeps the stale schedule out of the cache."""
+        calls = []
+
+        async def fake_schedule(params):
+            calls.append(params)
+            if len(calls) == 1:
+                script.invalidate_tasks_cache()
+            return f"schedule #{len(calls)}"
+
+        monkeypatch.setattr(script, "_build_schedule", fake_schedule)
+
+        assert await script.ticktick_get_today() == "schedule #1"
+        assert await script.ticktick_get_today() == "schedule #2"
+        assert await script.ticktick_get_today() == "schedule #2"
+
+    @pytest.mark.asyncio
+    async def test_failed_render_is_not_cached(self, script, token_path, monkeypatch):
+        """Test a failing schedule build is reported and retried next call."""
+        calls = []
+
+        async def fake_schedule(params):
+            calls.append(params)
+            if len(calls) == 1:
+                raise RuntimeError("api down")
+            return "schedule"
+
+        monkeypatch.setattr(script, "_build_schedule", fake_schedule)
+
+        assert "api down" in await script.ticktick_get_today()
+        assert await script.ticktick_get_today() == "schedule"
+        assert len(calls) == 2
+
+    def test_concurrent_callers_across_event_loops(self, script, token_path, monkeypatch):
+        """Test contended today calls work under repeated asyncio.run calls."""
+        async def fake_schedule(params):
+            await asyncio.sleep(0)
+            return "schedule"
+
+        monkeypatch.setattr(script, "_build_schedule", fake_schedule)
+
+        async def contend():
+            script.invalidate_tasks_cache()
+            return await asyncio.gather(script.ticktick_get_today(), script.ticktick_get_today())
+
+        for _ in range(2):
+            assert asyncio.run(contend()) == ["schedule", "schedule"]
+
+
+class TestHttpClient:
+    """Tests for the shared HTTP client."""
+
+    def test_client_lock_across_event_loops(self, script, monkeypatch):
+        """Test contended client creation works under repeated asyncio.run calls."""
+        monkeypatch.setattr(script, "_HTTP_CLIENT", None)
+
+        async def contend():
+            async with script._loop_lock("http"):
+                waiter = asyncio.create_task(script._get_http())
+                await asyncio.sleep(0)
+            client = await waiter
+            await client.aclose()
+
+        for _ in range(2):
+            asyncio.run(contend())
+
+
+class TestTasksCache:
+    """Tests for the cached project payloads."""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch_is_not_overwritten(self, script, token_path, monkeypatch):
+        """Test a write landing mid-fetch keeps the stale listing out of the cache."""
+        calls = []
+
+        async def fake_request(method, endpoint, **kwargs):
+            calls.append(endpoint)
+            if endpoint == "/project":
+                return [{"id": "p1"}]
+            if len(calls) == 2:
+                # A create completes while the first listing is in flight
+                script.invalidate_tasks_cache()
+                return {"tasks": []}
+            return {"tasks": [{"id": "new"}]}
+
+        monkeypatch.setattr(script, "api_request", fake_request)
+
+        stale = await script.fetch_all_project_data()
+        fresh = await script.fetch_all_project_data()
+
+        assert stale[0][1] == {"tasks": []}
+        assert fresh[0][1] == {"tasks": [{"id": "new"}]}
+        assert len(calls) == 4
+
+
+class TestFetchProjectData:
+    """Tests for per-project fetching with retries."""
+
+    @pytest.fixture
+    def delays(self, script, monkeypatch):
+        """Record backoff delays instead of sleeping."""
+        recorded = []
+
+        async def fake_sleep(delay):
+            recorded.append(delay)
+
+        monkeypatch.setattr(script, "_backoff_sleep", fake_sleep)
+        return recorded
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_failure(self, script, delays, monkeypatch):
+        """Test a rate-limited request succeeds on the next attempt."""
+        outcomes = [script.RateLimitError("slow down"), {"tasks": []}]
+
+        async def fake_request(method, endpoint, **kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(script, "api_request", fake_request)
+
+        assert await script.fetch_project_data("p1", asyncio.Semaphore(1)) == {"tasks": []}
+        assert delays == [0.1]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_retries(self, script, delays, monkeypatch):
+        """Test None is returned once transient failures exhaust the retries."""
+        calls = []
+
+        async def fake_request(method, endpoint, **kwargs):
+            calls.append(endpoint)
+            raise script.RateLimitError("slow down")
+
+        monkeypatch.setattr(script, "api_request", fake_request)
+
+        assert await script.fetch_project_data("p1", asyncio.Semaphore(1)) is None
+        assert len(calls) == script._PROJECT_FETCH_RETRIES + 1
+        assert delays == [0.1, 0.2]
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_raises(self, script, delays, monkeypatch):
+        """Test a non-transient error propagates without retrying."""
+        calls = []
+
+        async def fake_request(method, endpoint, **kwargs):
+            calls.append(endpoint)
+            raise ValueError("bad payload")
+
+        monkeypatch.setattr(script, "api_request", fake_request)
+
+        with pytest.raises(ValueError):
+            await script.fetch_project_data("p1", asyncio.Semaphore(1))
+        assert len(calls) == 1
+        assert delays == []
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_sibling_fetches(self, script, token_path, monkeypatch):
+        """Test the first hard failure cancels the other project fetches."""
+        cancelled = []
+
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "/project":
+                return [{"id": "bad"}, {"id": "slow"}]
+            if endpoint == "/project/bad/data":
+                raise ValueError("bad payload")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(endpoint)
+                raise
+
+        monkeypatch.setattr(script, "api_request", fake_request)
+
+        with pytest.raises(ValueError):
+            await script.fetch_all_project_data()
+        assert cancelled == ["/project/slow/data"]
+
+    def test_fan_out_across_event_loops(self, script, token_path, monkeypatch):
+        """Test repeated asyncio.run calls with more projects than the limit."""
+        projects = [{"id": f"p{i}"} for i in range(script._PROJECT_FETCH_CONCURRENCY * 2)]
+
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "/project":
+                return projects
+            await asyncio.sleep(0)
+            return {"tasks": []}
+
+        monkeypatch.setattr(script, "api_request", fake_request)
+
+        for _ in range(2):
+            script.invalidate_tasks_cache()
+            assert len(asyncio.run(script.fetch_all_project_data())) == len(projects)
+
+
+class TestJsonFiles:
+    """Tests for the atomic JSON file writer."""
+
+    def test_write_replaces_target(self, script, tmp_path):
+        """Test the file is written in full and no temp file is left over."""
+        path = str(tmp_path / "token.json")
+        script._write_json_file(path, {"access_token": "old"})
+        script._write_json_file(path, {"access_token": "new"})
+
+        assert script._read_json_file(path) == {"access_token": "new"}
+        assert [p.name for p in tmp_path.iterdir()] == ["token.json"]
+
+    def test_failed_write_removes_temp_file(self, script, tmp_path, monkeypatch):
+        """Test a failed serialization keeps the old file and cleans up."""
+        path = str(tmp_path / "token.json")
+        script._write_json_file(path, {"access_token": "old"})
+
+        def fail(obj):
+            raise TypeError("not serializable")
+
+        monkeypatch.setattr(script, "_json_dumps", fail)
+        with pytest.raises(TypeError):
+            script._write_json_file(path, {"access_token": "new"})
+
+        assert script._read_json_file(path) == {"access_token": "old"}
+        assert [p.name for p in tmp_path.iterdir()] == ["token.json"]
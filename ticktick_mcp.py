@@ -8,18 +8,33 @@ through TickTick's API.
 Author: Claude (built for Mostafa)
 """
 
+import asyncio
+import heapq
+import io
 import os
 import json
+import tempfile
+import time
 import httpx
-import webbrowser
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from importlib.util import find_spec
+from itertools import chain
+from operator import attrgetter, methodcaller
+from typing import Annotated, Optional, List, Dict, Any, Tuple
+from weakref import WeakKeyDictionary
 from enum import Enum
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 
 # ============================================================================
 # Configuration and Constants
@@ -31,9 +46,63 @@ TICKTICK_TOKEN_URL = "https://ticktick.com/oauth/token"
 DEFAULT_REDIRECT_URI = "http://127.0.0.1:8080/callback"
 TOKEN_CACHE_FILE = Path.home() / ".ticktick-mcp-token.json"
 CONFIG_FILE = Path.home() / ".ticktick-mcp-config.json"
+# str forms resolved once so file helpers skip per-call Path handling
+_TOKEN_CACHE_PATH = str(TOKEN_CACHE_FILE)
+_CONFIG_PATH = str(CONFIG_FILE)
+
+# Shared HTTP client: one connection pool for every API call (HTTP/2 if h2 is installed)
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_HTTP2 = find_spec("h2") is not None
+
+# Named locks per running event loop. An asyncio.Lock binds to the first loop
+# that waits on it, so module-level instances break once the loop is re-run.
+_LOOP_LOCKS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = WeakKeyDictionary()
+
+
+def _loop_lock(name: str) -> asyncio.Lock:
+    """Return the lock called name for the running event loop."""
+    locks = _LOOP_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    lock = locks.get(name)
+    if lock is None:
+        lock = locks[name] = asyncio.Lock()
+    return lock
+
+
+async def _get_http() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _HTTP_CLIENT
+    client = _HTTP_CLIENT
+    if client is not None and not client.is_closed:
+        return client
+    # Concurrent first callers (e.g. a gather fan-out) must not each build a pool
+    async with _loop_lock("http"):
+        if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+            _HTTP_CLIENT = httpx.AsyncClient(
+                http2=_HTTP2,
+                timeout=30.0,
+                # Keep idle connections warm between tool calls (httpx default is 5s)
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=20,
+                    keepalive_expiry=75.0,
+                ),
+                headers={"User-Agent": "ticktick-mcp"},
+            )
+        return _HTTP_CLIENT
+
+
+@asynccontextmanager
+async def _lifespan(server: "FastMCP"):
+    """Close the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        if _HTTP_CLIENT is not None:
+            await _HTTP_CLIENT.aclose()
+
 
 # Initialize MCP Server
-mcp = FastMCP("ticktick_mcp")
+mcp = FastMCP("ticktick_mcp", lifespan=_lifespan)
 
 
 # ============================================================================
@@ -64,43 +133,41 @@ class ResponseFormat(str, Enum):
 # Pydantic Input Models
 # ============================================================================
 
-class ConfigureInput(BaseModel):
+# Shared constrained type for required identifiers and credentials
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+
+class _StrictInput(BaseModel):
+    """Base for tool input models: trimmed strings, no extra keys, immutable."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid', frozen=True)
+
+
+class ConfigureInput(_StrictInput):
     """Input model for configuring TickTick credentials."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
-    client_id: str = Field(..., description="Your TickTick app Client ID from https://developer.ticktick.com/manage", min_length=1)
-    client_secret: str = Field(..., description="Your TickTick app Client Secret", min_length=1)
+    client_id: NonEmptyStr = Field(..., description="Your TickTick app Client ID from https://developer.ticktick.com/manage")
+    client_secret: NonEmptyStr = Field(..., description="Your TickTick app Client Secret")
     redirect_uri: str = Field(default=DEFAULT_REDIRECT_URI, description="OAuth redirect URI (default: http://127.0.0.1:8080/callback)")
 
 
-class AuthorizeInput(BaseModel):
+class AuthorizeInput(_StrictInput):
     """Input model for completing OAuth authorization."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
-    authorization_code: str = Field(..., description="The authorization code from the callback URL (the 'code' parameter)", min_length=1)
+    authorization_code: NonEmptyStr = Field(..., description="The authorization code from the callback URL (the 'code' parameter)")
 
 
-class ListTasksInput(BaseModel):
+class ListTasksInput(_StrictInput):
     """Input model for listing tasks."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
     project_id: Optional[str] = Field(default=None, description="Filter by project/list ID. Use 'inbox' for inbox tasks.")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format: 'markdown' or 'json'")
 
 
-class GetTaskInput(BaseModel):
+class GetTaskInput(_StrictInput):
     """Input model for getting a specific task."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
-    task_id: str = Field(..., description="The task ID to retrieve", min_length=1)
-    project_id: str = Field(..., description="The project/list ID containing the task", min_length=1)
+    task_id: NonEmptyStr = Field(..., description="The task ID to retrieve")
+    project_id: NonEmptyStr = Field(..., description="The project/list ID containing the task")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
 
-class CreateTaskInput(BaseModel):
+class CreateTaskInput(_StrictInput):
     """Input model for creating a new task."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
     title: str = Field(..., description="Task title", min_length=1, max_length=500)
     content: Optional[str] = Field(default=None, description="Task description/content", max_length=5000)
     project_id: Optional[str] = Field(default=None, description="Project/list ID. Leave empty for inbox.")
@@ -112,12 +179,10 @@ class CreateTaskInput(BaseModel):
     time_zone: Optional[str] = Field(default=None, description="Time zone (e.g., 'Africa/Cairo')")
 
 
-class UpdateTaskInput(BaseModel):
+class UpdateTaskInput(_StrictInput):
     """Input model for updating a task."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
-    task_id: str = Field(..., description="The task ID to update", min_length=1)
-    project_id: str = Field(..., description="The project/list ID containing the task", min_length=1)
+    task_id: NonEmptyStr = Field(..., description="The task ID to update")
+    project_id: NonEmptyStr = Field(..., description="The project/list ID containing the task")
     title: Optional[str] = Field(default=None, description="New task title", max_length=500)
     content: Optional[str] = Field(default=None, description="New task description", max_length=5000)
     start_date: Optional[str] = Field(default=None, description="New start date in ISO format")
@@ -126,58 +191,44 @@ class UpdateTaskInput(BaseModel):
     tags: Optional[List[str]] = Field(default=None, description="New list of tags")
 
 
-class CompleteTaskInput(BaseModel):
+class CompleteTaskInput(_StrictInput):
     """Input model for completing a task."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
-    task_id: str = Field(..., description="The task ID to complete", min_length=1)
-    project_id: str = Field(..., description="The project/list ID containing the task", min_length=1)
+    task_id: NonEmptyStr = Field(..., description="The task ID to complete")
+    project_id: NonEmptyStr = Field(..., description="The project/list ID containing the task")
 
 
-class DeleteTaskInput(BaseModel):
+class DeleteTaskInput(_StrictInput):
     """Input model for deleting a task."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
-    task_id: str = Field(..., description="The task ID to delete", min_length=1)
-    project_id: str = Field(..., description="The project/list ID containing the task", min_length=1)
+    task_id: NonEmptyStr = Field(..., description="The task ID to delete")
+    project_id: NonEmptyStr = Field(..., description="The project/list ID containing the task")
 
 
-class ListProjectsInput(BaseModel):
+class ListProjectsInput(_StrictInput):
     """Input model for listing projects/lists."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
 
-class CreateProjectInput(BaseModel):
+class CreateProjectInput(_StrictInput):
     """Input model for creating a project/list."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
     name: str = Field(..., description="Project/list name", min_length=1, max_length=100)
     color: Optional[str] = Field(default=None, description="Color in hex format (e.g., '#FF0000')")
     folder_id: Optional[str] = Field(default=None, description="Parent folder ID")
 
 
-class DeleteProjectInput(BaseModel):
+class DeleteProjectInput(_StrictInput):
     """Input model for deleting a project."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
-    project_id: str = Field(..., description="The project/list ID to delete", min_length=1)
+    project_id: NonEmptyStr = Field(..., description="The project/list ID to delete")
 
 
-class ScheduleTimeInput(BaseModel):
+class ScheduleTimeInput(_StrictInput):
     """Input model for scheduling/planning time."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
     date: Optional[str] = Field(default=None, description="Date to plan for in ISO format (defaults to today)")
     include_completed: bool = Field(default=False, description="Include completed tasks in analysis")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
 
-class GetCompletedTasksInput(BaseModel):
+class GetCompletedTasksInput(_StrictInput):
     """Input model for getting completed tasks."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
-    
     from_date: Optional[str] = Field(default=None, description="Start date for completed tasks range (ISO format)")
     to_date: Optional[str] = Field(default=None, description="End date for completed tasks range (ISO format)")
     project_id: Optional[str] = Field(default=None, description="Filter by project ID")
@@ -188,48 +239,126 @@ class GetCompletedTasksInput(BaseModel):
 # Helper Functions
 # ============================================================================
 
-def load_config() -> Dict[str, str]:
-    """Load configuration from file."""
-    if CONFIG_FILE.exists():
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
+# C-level sort key for task dicts, tolerating a missing priority
+_priority_key = methodcaller('get', 'priority', 0)
+
+
+# Parsed JSON files keyed by path: (mtime_ns, size, data). A stat per call
+# replaces a read + parse until the file changes on disk.
+_FILE_CACHE: Dict[str, Any] = {}
+
+
+def _read_json_file(path: str) -> Any:
+    """Read and parse a JSON file (blocking)."""
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _write_json_file(path: str, obj: Any) -> None:
+    """Serialize obj to a JSON file (blocking).
+
+    Writes a uniquely named sibling temp file and renames it over the
+    target, so an interrupted or concurrent save never leaves a truncated
+    file behind. No fsync: the token and config can always be recreated.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(_json_dumps(obj))
+        os.replace(tmp, path)
+    except BaseException:
         try:
-            return json.loads(CONFIG_FILE.read_text())
-        except Exception:
-            return {}
-    return {}
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+async def _read_json_cached(path: str) -> Dict[str, Any]:
+    """Read and parse a JSON file, reusing the last parse if unchanged.
+
+    The stat runs inline; the read and parse on a miss run in a worker
+    thread so disk I/O never blocks the event loop.
+    """
+    st = os.stat(path)
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = await asyncio.to_thread(_read_json_file, path)
+    _FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
-def save_config(config: Dict[str, str]) -> None:
+async def load_config() -> Dict[str, str]:
+    """Load configuration from file."""
+    try:
+        return await _read_json_cached(_CONFIG_PATH)
+    except Exception:
+        return {}
+
+
+async def save_config(config: Dict[str, str]) -> None:
     """Save configuration to file."""
-    CONFIG_FILE.write_text(json.dumps(config, indent=2))
+    await asyncio.to_thread(_write_json_file, _CONFIG_PATH, config)
+    _FILE_CACHE.pop(_CONFIG_PATH, None)
 
 
-def load_token() -> Optional[Dict[str, Any]]:
+async def load_token() -> Optional[Dict[str, Any]]:
     """Load cached access token."""
-    if TOKEN_CACHE_FILE.exists():
-        try:
-            token_data = json.loads(TOKEN_CACHE_FILE.read_text())
-            # Check if token is expired
-            if 'expire_time' in token_data:
-                if datetime.now().timestamp() < token_data['expire_time']:
-                    return token_data
-        except Exception:
-            pass
+    try:
+        token_data = await _read_json_cached(_TOKEN_CACHE_PATH)
+        # Check if token is expired
+        if 'expire_time' in token_data:
+            if time.time() < token_data['expire_time']:
+                return token_data
+    except Exception:
+        pass
     return None
 
 
-def save_token(token_data: Dict[str, Any]) -> None:
+async def save_token(token_data: Dict[str, Any]) -> None:
     """Save access token to cache."""
-    TOKEN_CACHE_FILE.write_text(json.dumps(token_data, indent=2))
+    await asyncio.to_thread(_write_json_file, _TOKEN_CACHE_PATH, token_data)
+    _FILE_CACHE.pop(_TOKEN_CACHE_PATH, None)
+    # A new token may belong to a different account
+    invalidate_tasks_cache()
 
 
-def get_access_token() -> Optional[str]:
+async def get_access_token() -> Optional[str]:
     """Get valid access token or None if not authenticated."""
-    token_data = load_token()
+    token_data = await load_token()
     if token_data:
         return token_data.get('access_token')
     return None
 
 
+class RateLimitError(Exception):
+    """Raised by api_request when TickTick answers 429 Too Many Requests."""
+
+
+# HTTP verb -> request coroutine factory taking (client, url, headers, data, params)
+_METHOD_DISPATCH = {
+    "GET": lambda client, url, headers, data, params: client.get(url, headers=headers, params=params),
+    "POST": lambda client, url, headers, data, params: client.post(url, headers=headers, json=data),
+    "PUT": lambda client, url, headers, data, params: client.put(url, headers=headers, json=data),
+    "DELETE": lambda client, url, headers, data, params: client.delete(url, headers=headers),
+}
+
+
 async def api_request(
     method: str,
     endpoint: str,
@@ -237,7 +366,7 @@ async def api_request(
     params: Optional[Dict] = None
 ) -> Dict[str, Any]:
     """Make an authenticated API request to TickTick."""
-    access_token = get_access_token()
+    access_token = await get_access_token()
     if not access_token:
         raise Exception("Not authenticated. Please run ticktick_configure and ticktick_authorize first.")
     
@@ -247,86 +376,302 @@ async def api_request(
         "Content-Type": "application/json"
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        if method.upper() == "GET":
-            response = await client.get(url, headers=headers, params=params)
-        elif method.upper() == "POST":
-            response = await client.post(url, headers=headers, json=data)
-        elif method.upper() == "PUT":
-            response = await client.put(url, headers=headers, json=data)
-        elif method.upper() == "DELETE":
-            response = await client.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        if response.status_code == 401:
+    send = _METHOD_DISPATCH.get(method.upper())
+    if send is None:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    client = await _get_http()
+    response = await send(client, url, headers, data, params)
+    
+    status = response.status_code
+    # One range check on the success path; error mapping only on failure
+    if not 200 <= status < 300:
+        if status == 401:
             raise Exception("Access token expired or invalid. Please re-authenticate using ticktick_authorize.")
-        elif response.status_code == 404:
+        elif status == 404:
             raise Exception("Resource not found. Please check the task/project ID.")
-        elif response.status_code == 429:
-            raise Exception("Rate limit exceeded. Please wait before making more requests.")
-        
+        elif status == 429:
+            raise RateLimitError("Rate limit exceeded. Please wait before making more requests.")
         response.raise_for_status()
-        
-        if response.status_code == 204 or not response.content:
-            return {"success": True}
-        
-        return response.json()
+    
+    content = response.content
+    if status == 204 or not content:
+        return {"success": True}
+    
+    # Parse the raw body; skips httpx's bytes -> str decode before parsing
+    return _json_loads(content)
+
+
+# Aggregated /project/{id}/data payloads: (expires_at, payloads). Repeated
+# listings within the TTL skip the per-project fan-out entirely.
+_TASKS_CACHE_TTL = 30.0
+_tasks_cache: Optional[tuple] = None
+# Bumped by invalidate_tasks_cache; a fetch that started under an older
+# generation raced a write and must not store its result.
+_tasks_generation = 0
+
+
+# Upper bound on concurrent per-project fetches during a fan-out
+_PROJECT_FETCH_CONCURRENCY = 16
+_PROJECT_FETCH_RETRIES = 2
+# Backoff delay between retries; a module hook so tests can skip the wait
+_backoff_sleep = asyncio.sleep
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Return True for transient failures: 429, 5xx, or a transport error."""
+    if isinstance(exc, (RateLimitError, httpx.TransportError)):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500
+
+
+async def fetch_project_data(
+    project_id: str, limit: asyncio.Semaphore
+) -> Optional[Dict[str, Any]]:
+    """Fetch one project's data payload, holding limit for each attempt.
+
+    Transient failures are retried with exponential backoff; None is
+    returned if they persist. Any other error propagates to the caller.
+    """
+    for attempt in range(_PROJECT_FETCH_RETRIES + 1):
+        try:
+            async with limit:
+                return await api_request("GET", f"/project/{project_id}/data")
+        except Exception as e:
+            if not _is_retryable(e):
+                raise
+        if attempt < _PROJECT_FETCH_RETRIES:
+            await _backoff_sleep(0.1 * 2 ** attempt)
+    return None
+
+
+# Rendered ticktick_get_today results: (date, include_completed, format) ->
+# (expires_at, text). The "today" loop lock lets concurrent callers share
+# one fetch.
+_TODAY_CACHE_TTL = 60.0
+_today_cache: Dict[tuple, tuple] = {}
+
+
+def invalidate_tasks_cache() -> None:
+    """Drop cached task data (project payloads and today's schedule) after a write."""
+    global _tasks_cache, _tasks_generation
+    _tasks_generation += 1
+    _tasks_cache = None
+    _today_cache.clear()
+
+
+async def fetch_all_project_data() -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Fetch every project with its data payload, cached for a short TTL.
+
+    Projects are fetched concurrently; a project that keeps failing
+    transiently is skipped, while any other error cancels the remaining
+    fetches and propagates. The returned (project, payload) pairs are
+    shared and must not be mutated.
+    """
+    global _tasks_cache
+    cached = _tasks_cache
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    
+    generation = _tasks_generation
+    projects = await api_request("GET", "/project")
+    # Created per fan-out: a module-level semaphore binds to the first event loop
+    limit = asyncio.Semaphore(_PROJECT_FETCH_CONCURRENCY)
+    fetches = [asyncio.ensure_future(fetch_project_data(project['id'], limit)) for project in projects]
+    try:
+        results = await asyncio.gather(*fetches)
+    except BaseException:
+        # gather leaves siblings running after the first failure; stop them
+        for fetch in fetches:
+            fetch.cancel()
+        await asyncio.gather(*fetches, return_exceptions=True)
+        raise
+    pairs = [(project, data) for project, data in zip(projects, results, strict=True) if data is not None]
+    if generation == _tasks_generation:
+        _tasks_cache = (time.monotonic() + _TASKS_CACHE_TTL, pairs)
+    return pairs
+
+
+@dataclass(slots=True)
+class TaskView:
+    """The task fields the schedule reads, extracted once per raw task."""
+    id: Optional[str]
+    project_id: Optional[str]
+    title: Optional[str]
+    status: int
+    priority: int
+    due_date: Optional[str]
+    start_date: Optional[str]
+    project_name: str
+    day: Optional[date]  # Calendar day of due_date or start_date, if parseable
+
+    @classmethod
+    def from_raw(cls, task: Dict[str, Any], project_name: str) -> "TaskView":
+        """Build a view from a raw API task dict."""
+        get = task.get
+        due_date = get('dueDate')
+        start_date = get('startDate')
+        when = due_date or start_date
+        day = None
+        if when:
+            try:
+                # Only the calendar date matters: parse the 'YYYY-MM-DD' prefix
+                day = date.fromisoformat(when[:10])
+            except (TypeError, ValueError):
+                pass
+        return cls(
+            get('id'), get('projectId'), get('title'), get('status', 0), get('priority', 0),
+            due_date, start_date, project_name, day,
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """Return the fields the schedule's JSON output reports."""
+        data = {
+            'id': self.id,
+            'projectId': self.project_id,
+            'title': self.title,
+            'status': self.status,
+            'priority': self.priority,
+            'dueDate': self.due_date,
+            'startDate': self.start_date,
+            '_project_name': self.project_name,
+        }
+        return {key: value for key, value in data.items() if value is not None}
+
+
+async def fetch_all_tasks_with_projects(
+    include_completed: bool = True,
+) -> Tuple[List[TaskView], Dict[str, str]]:
+    """Return a TaskView for every task, plus the project id -> name map.
+
+    Built on the cached project fan-out; views are new objects, so the
+    shared payloads are never touched. Completed tasks are dropped while
+    collecting unless include_completed is set.
+    """
+    pairs = await fetch_all_project_data()
+    project_names = {project['id']: project.get('name', 'Unknown') for project, _ in pairs}
+    from_raw = TaskView.from_raw
+    all_tasks = [
+        from_raw(task, project_names[project['id']])
+        for project, data in pairs
+        for task in data.get('tasks', [])
+        if include_completed or task.get('status', 0) != 2
+    ]
+    return all_tasks, project_names
+
+
+_PRIORITY_MAP = {0: "None", 1: "🟢 Low", 3: "🟡 Medium", 5: "🔴 High"}
+# Schedule bullet marker indexed by min(priority, 5)
+_PRIO_EMOJI = ("⚪", "⚪", "⚪", "🟡", "🟡", "🔴")
+
+
+# C-level sort key for TaskView lists
+_view_priority_key = attrgetter('priority')
+
+
+def _upcoming_key(task: TaskView) -> tuple:
+    """Order upcoming tasks nearest-first, higher priority first on ties."""
+    return (task.due_date or task.start_date or '9999', -task.priority)
+
+
+def _focus_bullet(task: TaskView, with_due: bool = False) -> str:
+    """Render a priority-focus schedule bullet."""
+    bullet = f"- {_PRIO_EMOJI[min(task.priority, 5)]} **{task.title}** (`{task.project_name}`)"
+    if with_due and task.due_date:
+        return f"{bullet}\n  - Due: {task.due_date[:10]}"
+    return bullet
+
+
+def _upcoming_bullet(task: TaskView) -> str:
+    """Render a 'Coming Up' schedule bullet."""
+    when = task.due_date or task.start_date
+    return f"- **{when[:10] if when else 'No date'}**: {task.title} (`{task.project_name}`)"
 
 
 def format_task_markdown(task: Dict) -> str:
     """Format a task as markdown."""
-    priority_map = {0: "None", 1: "🟢 Low", 3: "🟡 Medium", 5: "🔴 High"}
-    priority = priority_map.get(task.get('priority', 0), "None")
-    status = "✅ Complete" if task.get('status', 0) == 2 else "⬜ Incomplete"
+    get = task.get
+    priority = _PRIORITY_MAP.get(get('priority', 0), "None")
+    status = "✅ Complete" if get('status', 0) == 2 else "⬜ Incomplete"
     
     lines = [
-        f"### {task.get('title', 'Untitled')}",
-        f"- **ID**: `{task.get('id', 'N/A')}`",
+        f"### {get('title', 'Untitled')}",
+        f"- **ID**: `{get('id', 'N/A')}`",
         f"- **Status**: {status}",
         f"- **Priority**: {priority}",
     ]
+    append = lines.append
     
-    if task.get('projectId'):
-        lines.append(f"- **Project ID**: `{task.get('projectId')}`")
+    project_id = get('projectId')
+    if project_id:
+        append(f"- **Project ID**: `{project_id}`")
     
-    if task.get('content'):
-        lines.append(f"- **Description**: {task.get('content')}")
+    content = get('content')
+    if content:
+        append(f"- **Description**: {content}")
     
-    if task.get('dueDate'):
-        lines.append(f"- **Due Date**: {task.get('dueDate')}")
+    due_date = get('dueDate')
+    if due_date:
+        append(f"- **Due Date**: {due_date}")
     
-    if task.get('startDate'):
-        lines.append(f"- **Start Date**: {task.get('startDate')}")
+    start_date = get('startDate')
+    if start_date:
+        append(f"- **Start Date**: {start_date}")
     
-    if task.get('tags'):
-        tags = ', '.join([f"`{t}`" for t in task.get('tags', [])])
-        lines.append(f"- **Tags**: {tags}")
+    tags = get('tags')
+    if tags:
+        append(f"- **Tags**: {', '.join(f'`{t}`' for t in tags)}")
     
-    if task.get('items'):  # Subtasks/checklist items
-        lines.append("- **Checklist**:")
-        for item in task.get('items', []):
+    items = get('items')
+    if items:  # Subtasks/checklist items
+        append("- **Checklist**:")
+        for item in items:
             check = "✅" if item.get('status', 0) == 2 else "⬜"
-            lines.append(f"  - {check} {item.get('title', '')}")
+            append(f"  - {check} {item.get('title', '')}")
     
     return '\n'.join(lines)
 
 
+# Rendered task markdown keyed by (id, modifiedTime); TickTick bumps
+# modifiedTime on every edit, so a hit is always current.
+_TASK_MARKDOWN_CACHE: Dict[tuple, str] = {}
+_TASK_MARKDOWN_CACHE_SIZE = 1024
+
+
+def format_task_markdown_cached(task: Dict) -> str:
+    """Format a task as markdown, reusing the rendering of unchanged tasks."""
+    modified = task.get('modifiedTime')
+    if not modified:
+        return format_task_markdown(task)
+    key = (task.get('id'), modified)
+    text = _TASK_MARKDOWN_CACHE.get(key)
+    if text is None:
+        if len(_TASK_MARKDOWN_CACHE) >= _TASK_MARKDOWN_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _TASK_MARKDOWN_CACHE[next(iter(_TASK_MARKDOWN_CACHE))]
+        text = _TASK_MARKDOWN_CACHE[key] = format_task_markdown(task)
+    return text
+
+
 def format_project_markdown(project: Dict) -> str:
     """Format a project as markdown."""
+    get = project.get
     lines = [
-        f"### {project.get('name', 'Untitled')}",
-        f"- **ID**: `{project.get('id', 'N/A')}`",
+        f"### {get('name', 'Untitled')}",
+        f"- **ID**: `{get('id', 'N/A')}`",
     ]
     
-    if project.get('color'):
-        lines.append(f"- **Color**: {project.get('color')}")
+    color = get('color')
+    if color:
+        lines.append(f"- **Color**: {color}")
     
-    if project.get('groupId'):
-        lines.append(f"- **Folder ID**: `{project.get('groupId')}`")
+    group_id = get('groupId')
+    if group_id:
+        lines.append(f"- **Folder ID**: `{group_id}`")
     
-    if project.get('viewMode'):
-        lines.append(f"- **View Mode**: {project.get('viewMode')}")
+    view_mode = get('viewMode')
+    if view_mode:
+        lines.append(f"- **View Mode**: {view_mode}")
     
     return '\n'.join(lines)
 
@@ -364,7 +709,7 @@ async def ticktick_configure(params: ConfigureInput) -> str:
         "client_secret": params.client_secret,
         "redirect_uri": params.redirect_uri
     }
-    save_config(config)
+    await save_config(config)
     
     # Generate authorization URL
     auth_url = (
@@ -419,7 +764,7 @@ async def ticktick_authorize(params: AuthorizeInput) -> str:
     Returns:
         str: Success message or error details
     """
-    config = load_config()
+    config = await load_config()
     if not config.get('client_id') or not config.get('client_secret'):
         return "❌ **Error**: Please run `ticktick_configure` first to set up your credentials."
     
@@ -434,23 +779,24 @@ async def ticktick_authorize(params: AuthorizeInput) -> str:
     }
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                TICKTICK_TOKEN_URL,
-                data=token_data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
-            )
-            response.raise_for_status()
-            token_response = response.json()
+        client = await _get_http()
+        response = await client.post(
+            TICKTICK_TOKEN_URL,
+            data=token_data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+        response.raise_for_status()
+        token_response = _json_loads(response.content)
         
         # Calculate expiration time
         expires_in = token_response.get('expires_in', 15552000)  # Default 180 days
-        token_response['expire_time'] = datetime.now().timestamp() + expires_in
+        now = datetime.now()
+        token_response['expire_time'] = now.timestamp() + expires_in
         token_response['readable_expire_time'] = (
-            datetime.now() + timedelta(seconds=expires_in)
+            now + timedelta(seconds=expires_in)
         ).strftime('%Y-%m-%d %H:%M:%S')
         
-        save_token(token_response)
+        await save_token(token_response)
         
         return f"""## ✅ Authorization Successful!
 
@@ -492,8 +838,8 @@ async def ticktick_check_auth() -> str:
     Returns:
         str: Authentication status information
     """
-    config = load_config()
-    token_data = load_token()
+    config = await load_config()
+    token_data = await load_token()
     
     status_lines = ["## TickTick Authentication Status\n"]
     
@@ -535,51 +881,55 @@ async def ticktick_list_tasks(params: ListTasksInput) -> str:
     Returns:
         str: List of tasks in markdown or JSON format
     """
+    project_id = params.project_id
     try:
         # Get all tasks (TickTick API doesn't have direct filter by project in list endpoint)
         # We need to get project data first, then filter
-        if params.project_id:
+        if project_id:
             # Get specific project's tasks
-            data = await api_request("GET", f"/project/{params.project_id}/data")
-            tasks = data.get('tasks', [])
+            data = await api_request("GET", f"/project/{project_id}/data")
+            results = [data]
         else:
             # Get all projects and aggregate tasks
-            projects = await api_request("GET", "/project")
-            all_tasks = []
-            for project in projects:
-                try:
-                    data = await api_request("GET", f"/project/{project['id']}/data")
-                    all_tasks.extend(data.get('tasks', []))
-                except Exception:
-                    continue
-            tasks = all_tasks
-        
-        # Filter to incomplete tasks only
-        tasks = [t for t in tasks if t.get('status', 0) != 2]
+            results = [data for _, data in await fetch_all_project_data()]
+
+        # Keep incomplete tasks only; each payload already holds one project's tasks
+        groups = [
+            [t for t in data.get('tasks', []) if t.get('status', 0) != 2]
+            for data in results
+        ]
+        # Flatten per-project groups with C-level bulk extends
+        tasks = groups[0] if project_id else list(chain.from_iterable(groups))
         
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps({"tasks": tasks, "count": len(tasks)}, indent=2)
+        if params.response_format is ResponseFormat.JSON:
+            return _json_dumps({"tasks": tasks, "count": len(tasks)})
         
         if not tasks:
             return "## 📋 No incomplete tasks found.\n\nYou're all caught up! 🎉"
         
-        lines = [f"## 📋 Tasks ({len(tasks)} incomplete)\n"]
-        
-        # Group by project
-        tasks_by_project: Dict[str, List] = {}
-        for task in tasks:
-            proj_id = task.get('projectId', 'inbox')
-            if proj_id not in tasks_by_project:
-                tasks_by_project[proj_id] = []
-            tasks_by_project[proj_id].append(task)
-        
-        for proj_id, proj_tasks in tasks_by_project.items():
-            lines.append(f"\n### Project: `{proj_id}`\n")
-            for task in sorted(proj_tasks, key=lambda x: x.get('priority', 0), reverse=True):
-                lines.append(format_task_markdown(task))
-                lines.append("")
-        
-        return '\n'.join(lines)
+        if project_id:
+            # Single project: one section, nothing to group
+            project_groups = ((tasks[0].get('projectId', 'inbox'), tasks),)
+        else:
+            # Group by project, one payload at a time rather than task by task
+            tasks_by_project: Dict[str, List] = {}
+            for group in groups:
+                if group:
+                    tasks_by_project.setdefault(group[0].get('projectId', 'inbox'), []).extend(group)
+            project_groups = tasks_by_project.items()
+        
+        # Write sections straight into one buffer instead of joining a line list
+        out = io.StringIO()
+        write = out.write
+        write(f"## 📋 Tasks ({len(tasks)} incomplete)\n")
+        for proj_id, proj_tasks in project_groups:
+            write(f"\n\n### Project: `{proj_id}`\n")
+            for task in sorted(proj_tasks, key=_priority_key, reverse=True):
+                write("\n")
+                write(format_task_markdown_cached(task))
+                write("\n")
+        
+        return out.getvalue()
         
     except Exception as e:
         return f"❌ **Error listing tasks**: {str(e)}"
@@ -607,8 +957,8 @@ async def ticktick_get_task(params: GetTaskInput) -> str:
     try:
         task = await api_request("GET", f"/project/{params.project_id}/task/{params.task_id}")
         
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps(task, indent=2)
+        if params.response_format is ResponseFormat.JSON:
+            return _json_dumps(task)
         
         return format_task_markdown(task)
         
@@ -664,6 +1014,7 @@ async def ticktick_create_task(params: CreateTaskInput) -> str:
             task_data["timeZone"] = params.time_zone
         
         task = await api_request("POST", "/task", data=task_data)
+        invalidate_tasks_cache()
         
         return f"""## ✅ Task Created Successfully!
 
@@ -701,25 +1052,25 @@ async def ticktick_update_task(params: UpdateTaskInput) -> str:
         str: Updated task details
     """
     try:
-        # First get the existing task
-        existing_task = await api_request("GET", f"/project/{params.project_id}/task/{params.task_id}")
-        
-        # Merge updates
+        # The update endpoint accepts partial payloads (id and projectId are
+        # required), so send only the supplied fields instead of GET + merge
+        task_data = {"id": params.task_id, "projectId": params.project_id}
         if params.title:
-            existing_task["title"] = params.title
+            task_data["title"] = params.title
         if params.content is not None:
-            existing_task["content"] = params.content
+            task_data["content"] = params.content
         if params.start_date:
-            existing_task["startDate"] = params.start_date
+            task_data["startDate"] = params.start_date
         if params.due_date:
-            existing_task["dueDate"] = params.due_date
+            task_data["dueDate"] = params.due_date
         if params.priority is not None:
-            existing_task["priority"] = params.priority.value
+            task_data["priority"] = params.priority.value
         if params.tags is not None:
-            existing_task["tags"] = params.tags
+            task_data["tags"] = params.tags
         
         # Update the task
-        task = await api_request("POST", f"/task/{params.task_id}", data=existing_task)
+        task = await api_request("POST", f"/task/{params.task_id}", data=task_data)
+        invalidate_tasks_cache()
         
         return f"""## ✅ Task Updated Successfully!
 
@@ -751,6 +1102,7 @@ async def ticktick_complete_task(params: CompleteTaskInput) -> str:
     """
     try:
         await api_request("POST", f"/project/{params.project_id}/task/{params.task_id}/complete")
+        invalidate_tasks_cache()
         
         return f"""## ✅ Task Completed!
 
@@ -785,6 +1137,7 @@ async def ticktick_delete_task(params: DeleteTaskInput) -> str:
     """
     try:
         await api_request("DELETE", f"/project/{params.project_id}/task/{params.task_id}")
+        invalidate_tasks_cache()
         
         return f"""## 🗑️ Task Deleted
 
@@ -824,8 +1177,8 @@ async def ticktick_list_projects(params: ListProjectsInput) -> str:
     try:
         projects = await api_request("GET", "/project")
         
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps({"projects": projects, "count": len(projects)}, indent=2)
+        if params.response_format is ResponseFormat.JSON:
+            return _json_dumps({"projects": projects, "count": len(projects)})
         
         if not projects:
             return "## 📂 No projects found.\n\nCreate your first project with `ticktick_create_project`!"
@@ -873,6 +1226,7 @@ async def ticktick_create_project(params: CreateProjectInput) -> str:
             project_data["groupId"] = params.folder_id
         
         project = await api_request("POST", "/project", data=project_data)
+        invalidate_tasks_cache()
         
         return f"""## ✅ Project Created Successfully!
 
@@ -910,6 +1264,7 @@ async def ticktick_delete_project(params: DeleteProjectInput) -> str:
     """
     try:
         await api_request("DELETE", f"/project/{params.project_id}")
+        invalidate_tasks_cache()
         
         return f"""## 🗑️ Project Deleted
 
@@ -926,6 +1281,105 @@ The project and all its tasks have been permanently deleted.
 # MCP Tools - Time Management / Scheduling
 # ============================================================================
 
+async def _build_schedule(params: ScheduleTimeInput) -> str:
+    """Render the schedule for params; fetch and parse errors propagate."""
+    now = datetime.now()
+    target_date = params.date or now.date().isoformat()
+    
+    # Fetch all projects and their tasks
+    all_tasks, _ = await fetch_all_tasks_with_projects(params.include_completed)
+    
+    # Categorize tasks
+    today = date.fromisoformat(target_date)
+    
+    overdue = []
+    due_today = []
+    upcoming = []
+    no_date = []
+    
+    for task in all_tasks:
+        day = task.day
+        if day is None:
+            no_date.append(task)
+        elif day < today:
+            overdue.append(task)
+        elif day == today:
+            due_today.append(task)
+        else:
+            upcoming.append(task)
+    
+    # Sort by priority (high to low); reverse sorts stay stable on ties
+    overdue.sort(key=_view_priority_key, reverse=True)
+    due_today.sort(key=_view_priority_key, reverse=True)
+    no_date.sort(key=_view_priority_key, reverse=True)
+    # Only the nearest five upcoming tasks are shown: partial sort by date
+    upcoming_preview = heapq.nsmallest(5, upcoming, key=_upcoming_key)
+    
+    if params.response_format is ResponseFormat.JSON:
+        return _json_dumps({
+            "date": target_date,
+            "overdue": [task.to_json() for task in overdue],
+            "due_today": [task.to_json() for task in due_today],
+            "upcoming": [task.to_json() for task in upcoming_preview],  # Next 5 upcoming
+            "no_date": [task.to_json() for task in no_date[:10]]  # First 10 without dates
+        })
+    
+    # Generate markdown schedule: one preformatted string per section
+    parts = [
+        f"## 📅 Schedule for {target_date}\n\n"
+        f"*Generated: {now:%Y-%m-%d %H:%M}*\n",
+        "### 📊 Summary\n"
+        f"- **Overdue**: {len(overdue)} tasks\n"
+        f"- **Due Today**: {len(due_today)} tasks\n"
+        f"- **Upcoming**: {len(upcoming)} tasks\n"
+        f"- **Unscheduled**: {len(no_date)} tasks\n",
+        # Priority Focus Section
+        "---\n### 🎯 Priority Focus (Do First)\n",
+    ]
+    
+    if overdue:
+        bullets = "\n".join(_focus_bullet(task, with_due=True) for task in overdue[:5])
+        parts.append(f"#### 🔴 OVERDUE - Handle Immediately\n{bullets}\n")
+    
+    if due_today:
+        bullets = "\n".join(_focus_bullet(task) for task in due_today)
+        parts.append(f"#### 📌 Due Today\n{bullets}\n")
+    
+    # Suggested Time Blocks
+    parts.append("---\n### ⏰ Suggested Time Blocks\n")
+    
+    # Bucket by priority in one pass, without concatenating the source lists
+    high_priority = []
+    medium_priority = []
+    low_priority = []
+    for task in chain(overdue, due_today, no_date):
+        prio = task.priority
+        if prio >= 5:
+            high_priority.append(task)
+        elif prio == 3:
+            medium_priority.append(task)
+        elif prio <= 1:
+            low_priority.append(task)
+    
+    for heading, block, limit, empty in (
+        ("**Morning Focus (9:00 - 12:00)** - High Priority Tasks", high_priority, 3,
+         "- No high priority tasks!"),
+        ("**Afternoon Work (13:00 - 17:00)** - Medium Priority Tasks", medium_priority, 4,
+         "- No medium priority tasks!"),
+        ("**End of Day (17:00 - 18:00)** - Quick Wins / Low Priority", low_priority, 3,
+         "- No low priority tasks!"),
+    ):
+        bullets = "\n".join(f"- [ ] {task.title}" for task in block[:limit]) or empty
+        parts.append(f"{heading}\n{bullets}\n")
+    
+    # Upcoming Preview
+    if upcoming_preview:
+        bullets = "\n".join(_upcoming_bullet(task) for task in upcoming_preview)
+        parts.append(f"---\n### 📆 Coming Up\n\n{bullets}")
+    
+    return '\n'.join(parts)
+
+
 @mcp.tool(
     name="ticktick_schedule_time",
     annotations={
@@ -949,154 +1403,7 @@ async def ticktick_schedule_time(params: ScheduleTimeInput) -> str:
         str: Suggested schedule with time blocks
     """
     try:
-        target_date = params.date or datetime.now().strftime('%Y-%m-%d')
-        
-        # Fetch all projects and their tasks
-        projects = await api_request("GET", "/project")
-        all_tasks = []
-        project_names: Dict[str, str] = {}
-        
-        for project in projects:
-            project_names[project['id']] = project.get('name', 'Unknown')
-            try:
-                data = await api_request("GET", f"/project/{project['id']}/data")
-                for task in data.get('tasks', []):
-                    task['_project_name'] = project.get('name', 'Unknown')
-                    all_tasks.append(task)
-            except Exception:
-                continue
-        
-        # Filter tasks
-        if not params.include_completed:
-            all_tasks = [t for t in all_tasks if t.get('status', 0) != 2]
-        
-        # Categorize tasks
-        today = datetime.strptime(target_date, '%Y-%m-%d').date()
-        
-        overdue = []
-        due_today = []
-        upcoming = []
-        no_date = []
-        
-        for task in all_tasks:
-            due_str = task.get('dueDate') or task.get('startDate')
-            if due_str:
-                try:
-                    # Parse the date (handle various formats)
-                    due_date = datetime.fromisoformat(due_str.replace('Z', '+00:00')).date()
-                    if due_date < today:
-                        overdue.append(task)
-                    elif due_date == today:
-                        due_today.append(task)
-                    else:
-                        upcoming.append(task)
-                except Exception:
-                    no_date.append(task)
-            else:
-                no_date.append(task)
-        
-        # Sort by priority (high to low)
-        def sort_key(t):
-            return -t.get('priority', 0)
-        
-        overdue.sort(key=sort_key)
-        due_today.sort(key=sort_key)
-        upcoming.sort(key=sort_key)
-        no_date.sort(key=sort_key)
-        
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps({
-                "date": target_date,
-                "overdue": overdue,
-                "due_today": due_today,
-                "upcoming": upcoming[:5],  # Next 5 upcoming
-                "no_date": no_date[:10]  # First 10 without dates
-            }, indent=2)
-        
-        # Generate markdown schedule
-        lines = [
-            f"## 📅 Schedule for {target_date}",
-            "",
-            f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
-            ""
-        ]
-        
-        # Summary
-        total_today = len(overdue) + len(due_today)
-        lines.extend([
-            "### 📊 Summary",
-            f"- **Overdue**: {len(overdue)} tasks",
-            f"- **Due Today**: {len(due_today)} tasks",
-            f"- **Upcoming**: {len(upcoming)} tasks",
-            f"- **Unscheduled**: {len(no_date)} tasks",
-            ""
-        ])
-        
-        # Priority Focus Section
-        lines.append("---")
-        lines.append("### 🎯 Priority Focus (Do First)")
-        lines.append("")
-        
-        if overdue:
-            lines.append("#### 🔴 OVERDUE - Handle Immediately")
-            for task in overdue[:5]:
-                priority_emoji = "🔴" if task.get('priority', 0) >= 5 else "🟡" if task.get('priority', 0) >= 3 else "⚪"
-                lines.append(f"- {priority_emoji} **{task.get('title')}** (`{task.get('_project_name')}`)")
-                if task.get('dueDate'):
-                    lines.append(f"  - Due: {task.get('dueDate')[:10]}")
-            lines.append("")
-        
-        if due_today:
-            lines.append("#### 📌 Due Today")
-            for task in due_today:
-                priority_emoji = "🔴" if task.get('priority', 0) >= 5 else "🟡" if task.get('priority', 0) >= 3 else "⚪"
-                lines.append(f"- {priority_emoji} **{task.get('title')}** (`{task.get('_project_name')}`)")
-            lines.append("")
-        
-        # Suggested Time Blocks
-        lines.append("---")
-        lines.append("### ⏰ Suggested Time Blocks")
-        lines.append("")
-        
-        high_priority = [t for t in (overdue + due_today + no_date) if t.get('priority', 0) >= 5]
-        medium_priority = [t for t in (overdue + due_today + no_date) if t.get('priority', 0) == 3]
-        low_priority = [t for t in (overdue + due_today + no_date) if t.get('priority', 0) <= 1]
-        
-        lines.append("**Morning Focus (9:00 - 12:00)** - High Priority Tasks")
-        if high_priority:
-            for task in high_priority[:3]:
-                lines.append(f"- [ ] {task.get('title')}")
-        else:
-            lines.append("- No high priority tasks!")
-        lines.append("")
-        
-        lines.append("**Afternoon Work (13:00 - 17:00)** - Medium Priority Tasks")
-        if medium_priority:
-            for task in medium_priority[:4]:
-                lines.append(f"- [ ] {task.get('title')}")
-        else:
-            lines.append("- No medium priority tasks!")
-        lines.append("")
-        
-        lines.append("**End of Day (17:00 - 18:00)** - Quick Wins / Low Priority")
-        if low_priority:
-            for task in low_priority[:3]:
-                lines.append(f"- [ ] {task.get('title')}")
-        else:
-            lines.append("- No low priority tasks!")
-        lines.append("")
-        
-        # Upcoming Preview
-        if upcoming:
-            lines.append("---")
-            lines.append("### 📆 Coming Up")
-            lines.append("")
-            for task in upcoming[:5]:
-                due = task.get('dueDate', task.get('startDate', ''))[:10] if task.get('dueDate') or task.get('startDate') else 'No date'
-                lines.append(f"- **{due}**: {task.get('title')} (`{task.get('_project_name')}`)")
-        
-        return '\n'.join(lines)
-        
+        return await _build_schedule(params)
     except Exception as e:
         return f"❌ **Error generating schedule**: {str(e)}"
 
@@ -1121,11 +1428,23 @@ async def ticktick_get_today() -> str:
     """
     try:
         # Use schedule_time with today's date
-        return await ticktick_schedule_time(ScheduleTimeInput(
-            date=datetime.now().strftime('%Y-%m-%d'),
+        schedule = ScheduleTimeInput(
+            date=date.today().isoformat(),
             include_completed=False,
             response_format=ResponseFormat.MARKDOWN
-        ))
+        )
+        key = (schedule.date, schedule.include_completed, schedule.response_format)
+        async with _loop_lock("today"):
+            cached = _today_cache.get(key)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+            generation = _tasks_generation
+            # Failures raise, so only successful renders reach the cache
+            result = await _build_schedule(schedule)
+            # Skip the store if a write invalidated the cache mid-render
+            if generation == _tasks_generation:
+                _today_cache[key] = (time.monotonic() + _TODAY_CACHE_TTL, result)
+            return result
         
     except Exception as e:
         return f"❌ **Error getting today's tasks**: {str(e)}"